@@ -6,43 +6,59 @@
 #                                     #
 #######################################
 
-import Tkinter
-import tkFont
-import tkMessageBox
-from ttk import Separator
-from inspect import getdoc, getargspec
+import inspect
+try:
+    import Tkinter
+    import tkFont
+    import tkMessageBox
+    from ttk import Separator
+except ImportError:  # Python 3 names
+    import tkinter as Tkinter
+    import tkinter.font as tkFont
+    import tkinter.messagebox as tkMessageBox
+    from tkinter.ttk import Separator
+
+_FONT_CACHE = {}  # tkFont.Font objects keyed by (family, size)
+_WIDTH_CACHE = {}  # measured text widths keyed by (text, family, size)
+_WIDTH_CACHE_MAX = 4096
+_SIGNATURE_CACHE = {}  # formatted function signatures keyed by function
+_NAME_CACHE = {}  # widget names keyed by (class, fullyqualified)
+_DOC_CACHE = {}  # cleaned docstrings keyed by class or function
 
 
 def getwidgetname(widget, fullyqualified=False):
-    name = widget.__class__.__name__
-    if fullyqualified:
-        name = ".".join([widget.__class__.__module__, name])
+    key = (widget.__class__, fullyqualified)
+    name = _NAME_CACHE.get(key)
+    if name is None:
+        name = widget.__class__.__name__
+        if fullyqualified:
+            name = ".".join([widget.__class__.__module__, name])
+        _NAME_CACHE[key] = name
     return name
 
 
+def getdoc(obj):
+    # docstrings are fixed per class/function, so instances and bound methods share their owner's entry
+    if inspect.ismethod(obj):
+        key = obj.__func__
+    elif inspect.isclass(obj) or inspect.isfunction(obj) or inspect.ismodule(obj):
+        key = obj
+    else:
+        key = obj.__class__
+    try:
+        doc = _DOC_CACHE[key]
+    except KeyError:
+        doc = _DOC_CACHE[key] = inspect.getdoc(obj)
+    return doc
+
+
 def getfunctionsignature(func):
-    argspec = getargspec(func)
-    args = argspec[0]
-    varargs = argspec[1]
-    kwargs = argspec[2]
-    defaults = list(argspec[3])
-    argsig = ""
-    if kwargs:
-        argsig = "**" + kwargs
-    if varargs:
-        sep = ["", ", "][len(argsig) > 0]
-        argsig = sep.join("*" + varargs, argsig)
-    while len(args):
-        arg = args.pop()
-        try:
-            default = defaults.pop()
-        except IndexError:
-            pass
-        else:
-            arg = "=".join([arg, str(default)])
-        sep = ["", ", "][len(argsig) > 0]
-        argsig = sep.join([arg, argsig])
-    return func.__name__ + "(" + argsig + ")"
+    # the signature of a function never changes, so format it only once per function object
+    key = getattr(func, '__func__', func)
+    signature = _SIGNATURE_CACHE.get(key)
+    if signature is None:
+        signature = _SIGNATURE_CACHE[key] = func.__name__ + inspect.formatargspec(*inspect.getargspec(func))
+    return signature
 
 
 def showinfo(module):
@@ -54,28 +70,53 @@ def showinfo(module):
     tkMessageBox.showinfo(about_title, about_msg)
 
 
-def gettextwidth(text, family=None, size=None):
-    if family and size:
-        width = tkFont.Font(family=family, size=size).measure(text)
-    elif family:
-        width = tkFont.Font(family=family).measure(text)
+def getfont(family=None, size=None):
+    # Tk font objects are created once per (family, size) and then reused
+    key = (family, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        if family and size:
+            font = tkFont.Font(family=family, size=size)
+        elif family:
+            font = tkFont.Font(family=family)
+        else:
+            font = tkFont.Font()
+        _FONT_CACHE[key] = font
+    return font
+
+
+def gettextwidth(text, family=None, size=None, font=None):
+    # a preconstructed font can be given instead of family/size
+    if font is not None:
+        key = (text, str(font))
     else:
-        width = tkFont.Font().measure(text)
+        # normalize args so equivalent calls share the same cache entries (size is only used along with family)
+        if not family:
+            family = size = None
+        elif not size:
+            size = None
+        key = (text, family, size)
+    width = _WIDTH_CACHE.get(key)
+    if width is None:
+        if len(_WIDTH_CACHE) >= _WIDTH_CACHE_MAX:
+            _WIDTH_CACHE.clear()
+        if font is None:
+            font = getfont(family, size)
+        width = _WIDTH_CACHE[key] = font.measure(text)
     return width
 
 
 class WidgetData(object):
+    __slots__ = ('widget', 'dataframe')
+
     def __init__(self, widget=None, **data):
         self.widget = widget
         self.dataframe = Tkinter.Frame()
-        row = 0
-        for name, value in data.items():
-            self.add_datablock(row, name, value)
-            row += 1
-
-    def add_datablock(self, row, name, value):
-        Tkinter.Label(self.dataframe, text=name).grid(row=row, column=0)
-        Tkinter.Label(self.dataframe, text=value).grid(row=row, column=1)
+        # one multi-line label per column instead of a pair of labels per row
+        names = '\n'.join(data.keys())
+        values = '\n'.join(str(value) for value in data.values())
+        Tkinter.Label(self.dataframe, text=names).grid(row=0, column=0)
+        Tkinter.Label(self.dataframe, text=values).grid(row=0, column=1)
 
 
 class WidgetBlock(Tkinter.Frame):
@@ -89,9 +130,10 @@ class WidgetBlock(Tkinter.Frame):
             # row = [0,3][i%2]
             # col = (i//2)*3
             row = (i // 2) * 2
-            col = [0, 3][i % 2]
-            widgetdata[i].widget.grid(in_=self, row=row, column=col)
-            widgetdata[i].dataframe.grid(in_=self, row=row, column=col + 1)
+            col = 3 * (i & 1)
+            data = widgetdata[i]
+            data.widget.grid(in_=self, row=row, column=col)
+            data.dataframe.grid(in_=self, row=row, column=col + 1)
             if col == 0 and n - i > 3:
                 # Separator(self, orient=Tkinter.VERTICAL).grid(row=row, column=col+2, rowspan=3, sticky='ns')
                 Separator(self, orient=Tkinter.HORIZONTAL).grid(row=row + 1, column=col, columnspan=5, sticky='ew')
@@ -106,5 +148,9 @@ class ErrorDisplay(Tkinter.Canvas):
     def __init__(self, master, size, error=None):
         Tkinter.Canvas.__init__(self, master, width=size, height=size, borderwidth=0, highlightthickness=0)
         self.create_text(size / 2, size / 2, text='CANNOT\n DISPLAY\n  IMAGE')
-        if error:
-            self.create_text(size / 2, size, text='ERROR: ' + str(error), fill='red', width=size)
+        self.create_text(size / 2, size, fill='red', width=size, tags='error')
+        self.set_error(error)
+
+    def set_error(self, error=None):
+        """Replaces the error message shown, so one display can be reused for successive errors"""
+        self.itemconfig('error', text='ERROR: ' + str(error) if error else '')
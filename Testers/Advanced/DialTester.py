@@ -15,12 +15,43 @@ from viewidget import Dial, Digit
 import CommonTestTools as Ctt
 
 
+def parse_number(text):
+    """Converts entry text to an int, or a float if it is not a whole number"""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_value(text):
+    """Converts entry text to a number like parse_number; 'None' is accepted, as Dial takes value=None"""
+    if text.strip() == 'None':
+        return None
+    return parse_number(text)
+
+
+def parse_bool(text):
+    """Converts entry text to a boolean; only True/False/1/0 are accepted"""
+    try:
+        return {'True': True, 'False': False, '1': True, '0': False}[text.strip()]
+    except KeyError:
+        raise ValueError('invalid boolean: %r' % text)
+
+
+# Name, signature and indented docstring of Dial.__init__ for the Construction tab; fixed once the module is imported
+_tab = '\t'.expandtabs(4)
+CONSTRUCTION_NAME = Dial.__name__ + '.__init__'
+CONSTRUCTION_DOC = '\n'.join([Ctt.getfunctionsignature(Dial.__init__),
+                              _tab + Ctt.getdoc(Dial.__init__).replace('\n', '\n' + _tab)])
+
+
 class Introduction(Tkinter.Frame):
     """Provides an introduction from Dial's docstring"""
 
+    title = 'Introduction\n'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Introduction\n'
         innerframe = Tkinter.Frame(self)
         widget = Dial(innerframe, unit='degF')
         widget.pack(side='right')
@@ -36,20 +67,16 @@ class Introduction(Tkinter.Frame):
 class Construction(Tkinter.Frame):
     """Provides information on Dial's __init__ function"""
 
+    title = 'Construction\n'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Construction\n'
         innerframe = Tkinter.Frame(self)
         widget = Dial(innerframe, size=275, casewidth=10, min=0, max=100, value=14.7, unit='psi', withdisplay=False)
         widget.pack(side='right')
         docframe = Tkinter.Frame(innerframe)
-        name = Ctt.getwidgetname(widget) + ".__init__"
-        sig = Ctt.getfunctionsignature(widget.__init__)
-        doc = Ctt.getdoc(widget.__init__)
-        t = '\t'.expandtabs(4)
-        doc = t + doc.replace('\n', '\n' + t)
-        Tkinter.Label(docframe, text=name, font=('Helvetica', 16, 'bold')).pack(side='top', pady=2)
-        Tkinter.Label(docframe, text='\n'.join([sig, doc]), justify='left').pack(side='bottom')
+        Tkinter.Label(docframe, text=CONSTRUCTION_NAME, font=('Helvetica', 16, 'bold')).pack(side='top', pady=2)
+        Tkinter.Label(docframe, text=CONSTRUCTION_DOC, justify='left').pack(side='bottom')
         docframe.pack(side='left')
         innerframe.pack(side='left', fill='x', expand=1, padx=50)
 
@@ -57,9 +84,10 @@ class Construction(Tkinter.Frame):
 class SizeCasewidthValue(Tkinter.Frame):
     """Demonstrates Dial configuration functionality: size, casewidth and value"""
 
+    title = 'size, casewidth\nand value'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'size, casewidth\nand value'
 
         widget1 = Dial()  # Default: size=300, casewidth=15, value=min
         widget2 = Dial(size=150, casewidth=7, value=220)
@@ -76,9 +104,10 @@ class SizeCasewidthValue(Tkinter.Frame):
 class StartExtentMinMax(Tkinter.Frame):
     """Demonstrates Dial configuration functionality: start, extent, min, and max"""
 
+    title = 'start/extent and\nmin/max'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'start/extent and\nmin/max'
 
         widget1 = Dial()  # Default: start=225, extent=-270, min=60, max=220
         widget2 = Dial(min=0, max=100)
@@ -95,9 +124,10 @@ class StartExtentMinMax(Tkinter.Frame):
 class ScaleUnit(Tkinter.Frame):
     """Demonstrates Dial configuration functionality: majorscale, semimajorscale, minorscale, and unit"""
 
+    title = 'scale and unit\n(markings)'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'scale and unit\n(markings)'
 
         widget1 = Dial()  # Default: majorscale=20, semimajorscale=10, minorscale=2, unit=None
         widget2 = Dial(semimajorscale=0, minorscale=0, unit='psi')
@@ -114,9 +144,10 @@ class ScaleUnit(Tkinter.Frame):
 class BoundWithdisplay(Tkinter.Frame):
     """Demonstrates Dial configuration functionality: bound and withdisplay"""
 
+    title = 'bound and\nwithdisplay'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'bound and\nwithdisplay'
 
         widget1 = Dial(value=55)  # Default: bound=True, withdisplay=True
         widget2 = Dial(bound=False, value=55)
@@ -133,6 +164,8 @@ class BoundWithdisplay(Tkinter.Frame):
 class Demonstration(Tkinter.Frame):
     """Allows the user to try out the Dial's features interactively"""
 
+    title = 'Interactive\nDemonstration'
+
     DEFAULT_CONFIG = dict(size=300,
                           casewidth=15,
                           start=225,
@@ -147,13 +180,29 @@ class Demonstration(Tkinter.Frame):
                           bound=True,
                           value=60)
 
+    # Parser for each entry's text (unit is read as plain text in refresh)
+    PARSERS = dict(size=parse_number,
+                   casewidth=parse_number,
+                   start=parse_number,
+                   extent=parse_number,
+                   min=parse_number,
+                   max=parse_number,
+                   majorscale=parse_number,
+                   semimajorscale=parse_number,
+                   minorscale=parse_number,
+                   withdisplay=parse_bool,
+                   bound=parse_bool,
+                   value=parse_value)
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Interactive\nDemonstration'
 
         self.dial_config = Demonstration.DEFAULT_CONFIG.copy()
         self.dial = Dial(self, **self.dial_config)
         self.dial.pack(side='left', fill='y', expand=1, pady=20)
+        # Config of the Dial currently shown (None when showing an error) and the entries its warnings flagged
+        self._last_config = self.dial_config.copy()
+        self._warnkeys = set()
 
         # Interact subframe
         self.interactframe = Tkinter.Frame(self)
@@ -161,15 +210,23 @@ class Demonstration(Tkinter.Frame):
         Tkinter.Label(self.interactframe, text="Please enter Dial options...*").pack(anchor='w', pady=5)
         # Entry frame contains config variable keys as labels and corresponding entry widgets with values of each key
         self.entryframe = Tkinter.Frame(self.interactframe)
+        # <Return> is bound once on the entry frame and each entry gets the frame's bindtag
+        self.entryframe.bind('<Return>', lambda e: self.refresh())
+        entrytag = str(self.entryframe)
+        self._entries = {}
         row = 0
         for key, value in self.dial_config.items():
             Tkinter.Label(self.entryframe, text=key).grid(row=row, column=0)
             ent = Tkinter.Entry(self.entryframe, name=key)
             ent.insert(0, str(value))
-            ent.bind('<Return>', lambda e: self.refresh())
+            ent.bindtags((entrytag,) + ent.bindtags())
             ent.grid(row=row, column=1)
+            self._entries[key] = ent
             row += 1
         self.entryframe.pack()
+        # Last text read from each entry and the value it parsed to
+        self._last_input = {}
+        self._last_parsed = {}
         # Reset and animate buttons
         self.animate_button = Tkinter.Button(self.interactframe, text='Animate', width=10,
                                              command=lambda: Animation(self, **self.dial_config))
@@ -185,7 +242,8 @@ class Demonstration(Tkinter.Frame):
         # Parse config inputs (catch input eval errors)
         haserror = False
         for key in self.dial_config:
-            input = self.entryframe.nametowidget(key).get()
+            ent = self._entries[key]
+            input = ent.get()
             if key == 'unit':
                 # Only config option that takes text
                 if input == 'None':
@@ -194,15 +252,29 @@ class Demonstration(Tkinter.Frame):
                     self.dial_config[key] = input
             else:
                 try:
-                    self.dial_config[key] = eval(input)
+                    self.dial_config[key] = self.parse(key, input)
                 except Exception, error:
                     haserror = True
-                    self.entryframe.nametowidget(key).config(bg='red')
+                    ent.config(bg='red')
                 else:
-                    self.entryframe.nametowidget(key).config(bg='white')
+                    ent.config(bg='white')
+
+        # Reuse the current Dial if nothing besides its value changed
+        if not haserror and self._last_config is not None:
+            changed = set(key for key in self.dial_config if self.dial_config[key] != self._last_config[key])
+            if changed <= {'value'}:
+                if changed:
+                    self.dial.set_value(self.dial_config['value'])
+                # warnings drawn on the Dial still apply, so keep their entries flagged
+                for key in self._warnkeys:
+                    self._entries[key].config(bg='gold')
+                self._last_config = self.dial_config.copy()
+                return
 
         # Draw new Dial (catch Dial constructor errors and warnings)
         self.dial.destroy()
+        self._last_config = None
+        self._warnkeys = set()
         if haserror:
             size = Demonstration.DEFAULT_CONFIG['size']
             self.dial = Ctt.ErrorDisplay(self, size, error)
@@ -215,20 +287,21 @@ class Demonstration(Tkinter.Frame):
                     haserror = True
                     size = Demonstration.DEFAULT_CONFIG['size']
                     self.dial = Ctt.ErrorDisplay(self, size, error)
-                    for key in self.dial_config:
-                        if any(key == word for word in str(error).split(' ')):
-                            self.entryframe.nametowidget(key).config(bg='red')
+                    for key in set(str(error).split()).intersection(self.dial_config):
+                        self._entries[key].config(bg='red')
                 else:
+                    self._last_config = self.dial_config.copy()
                     offset = 0
+                    font = Ctt.getfont()
                     for warn in warns:
                         warn_message = str(warn.message)
                         warn_text = 'WARNING: ' + warn_message
                         size = self.dial_config['size']
                         self.dial.create_text(size / 2, size - offset, text=warn_text, fill='gold', width=size)
-                        offset += 10 * (Ctt.gettextwidth(warn_text) // size + 2)
-                        for key in self.dial_config:
-                            if any(key == word for word in warn_message.split(' ')):
-                                self.entryframe.nametowidget(key).config(bg='gold')
+                        offset += 10 * (Ctt.gettextwidth(warn_text, font=font) // size + 2)
+                        for key in set(warn_message.split()).intersection(self.dial_config):
+                            self._entries[key].config(bg='gold')
+                            self._warnkeys.add(key)
         self.dial.pack(side='left', fill='y', expand=1, pady=20)
         if haserror:
             self.animate_button.config(state=Tkinter.DISABLED)
@@ -237,10 +310,17 @@ class Demonstration(Tkinter.Frame):
 
     # end refresh
 
+    def parse(self, key, input):
+        """Converts the text of an entry to a value; reuses the last value if the text has not changed"""
+        if self._last_input.get(key) != input:
+            self._last_parsed[key] = Demonstration.PARSERS[key](input)
+            self._last_input[key] = input
+        return self._last_parsed[key]
+
     def reset(self):
         """Resets back to the default configuration"""
         for key, value in Demonstration.DEFAULT_CONFIG.items():
-            ent = self.entryframe.nametowidget(key)
+            ent = self._entries[key]
             ent.delete(0, Tkinter.END)
             ent.insert(0, str(value))
         self.refresh()
@@ -267,6 +347,7 @@ class Animation(Tkinter.Toplevel):
 
         # Run parameters
         self.entryframe = Tkinter.Frame(self)
+        self._run_entries = {}
         units = config['unit']
         if not units:
             units = 'units'
@@ -276,6 +357,7 @@ class Animation(Tkinter.Toplevel):
         ent = Tkinter.Entry(self.entryframe, name=name)
         ent.insert(0, str(config['min']))
         ent.grid(row=0, column=1)
+        self._run_entries[name] = ent
         Tkinter.Label(self.entryframe, text=units).grid(row=0, column=2)
         # Run max
         name = 'run max'
@@ -283,6 +365,7 @@ class Animation(Tkinter.Toplevel):
         ent = Tkinter.Entry(self.entryframe, name=name)
         ent.insert(0, str(config['max']))
         ent.grid(row=1, column=1)
+        self._run_entries[name] = ent
         Tkinter.Label(self.entryframe, text=units).grid(row=1, column=2)
         # Run speed
         name = 'run speed'
@@ -290,8 +373,12 @@ class Animation(Tkinter.Toplevel):
         ent = Tkinter.Entry(self.entryframe, name=name)
         ent.insert(0, str(1))
         ent.grid(row=2, column=1)
+        self._run_entries[name] = ent
         Tkinter.Label(self.entryframe, text=units + "/sec").grid(row=2, column=2)
         self.entryframe.pack()
+        # Last text read from each run entry and its parsed value (None if invalid)
+        self._run_inputs = {}
+        self._run_values = {}
 
         # Start/Stop button
         self.button = Tkinter.Button(self, text='Start', width=10, command=self.startstop)
@@ -303,6 +390,7 @@ class Animation(Tkinter.Toplevel):
         Tkinter.Label(self, text="Note: Stopping causes direction\nto reverse upon restart.").pack(pady=5)
         self.isrunning = False
         self.direction = 1
+        self.animation_id = None
         self.focus_set()
 
     def start(self):
@@ -322,36 +410,32 @@ class Animation(Tkinter.Toplevel):
         else:
             self.start()
 
+    def read_entry(self, name):
+        """Returns the float value of a run entry (None if invalid); the text is only parsed when it changes"""
+        input = self._run_entries[name].get()
+        if input != self._run_inputs.get(name):
+            self._run_inputs[name] = input
+            try:
+                value = float(input)
+            except Exception:
+                value = None
+                self._run_entries[name].config(bg='red')
+            else:
+                self._run_entries[name].config(bg='white')
+            self._run_values[name] = value
+        return self._run_values[name]
+
     def animation(self):
         wait = 100  # ms
-        has_error = False
-        name = 'run max'
-        try:
-            run_max = float(self.entryframe.nametowidget(name).get())
-            self.entryframe.nametowidget(name).config(bg='white')
-        except Exception:
-            has_error = True
-            self.entryframe.nametowidget(name).config(bg='red')
-        name = 'run min'
-        try:
-            run_min = float(self.entryframe.nametowidget(name).get())
-            self.entryframe.nametowidget(name).config(bg='white')
-        except Exception:
-            has_error = True
-            self.entryframe.nametowidget(name).config(bg='red')
-        name = 'run speed'
-        try:
-            run_speed = float(self.entryframe.nametowidget(name).get())
-            self.entryframe.nametowidget(name).config(bg='white')
-        except Exception:
-            has_error = True
-            self.entryframe.nametowidget(name).config(bg='red')
-        if not has_error:
+        run_max = self.read_entry('run max')
+        run_min = self.read_entry('run min')
+        run_speed = self.read_entry('run speed')
+        if None not in (run_max, run_min, run_speed):
+            dial = self.dial
             delta = self.direction * run_speed * wait / 1000.0
-            value = self.dial.value + delta
-            value = min(max(value, run_min), run_max)
-            self.dial.set_value(value)
-            self.update_idletasks()
+            value = min(max(dial.value + delta, run_min), run_max)
+            if value != dial.value:
+                dial.set_value(value)
             if value == run_max:
                 self.direction = -1
                 wait *= 4
@@ -361,10 +445,9 @@ class Animation(Tkinter.Toplevel):
         self.animation_id = self.after(wait, self.animation)
 
     def cancel_animation(self):
-        try:
+        if self.animation_id is not None:
             self.after_cancel(self.animation_id)
-        except Exception:
-            pass
+            self.animation_id = None
 
     def cancel(self):
         self.cancel_animation()
@@ -375,9 +458,10 @@ class Animation(Tkinter.Toplevel):
 class Advanced(Tkinter.Frame):
     """Demonstrates some of the Dial's more advanced features"""
 
+    title = 'Advanced\nDesign'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Advanced\nDesign'
 
         msg = "The Dial has additional methods for configuration after construction. "
         msg += "Many of these methods capitalize on Tkinter's functionality. Objects\n"
@@ -397,7 +481,8 @@ class Advanced(Tkinter.Frame):
         minorticks = self.dial.find_withtag('minorscale_ticks')
         redline = minorticks[int(3.0 / 4 * len(minorticks)):]  # Add redline to 3/4 of final scale
         for minortick in redline:
-            self.dial.itemconfig(minortick, fill='red', width=6)
+            self.dial.addtag_withtag('redline', minortick)
+        self.dial.itemconfig('redline', fill='red', width=6)
         # Add Viewidget Digit to look better than standard Dial withdisplay functionality.
         # Note this takes some playing around with the sizes, and would take additional effort
         # to make it dynamic with Dial size.
@@ -410,11 +495,15 @@ class Advanced(Tkinter.Frame):
         for dialdigit in self.dial.digits:
             dialdigit.pack(side='left')
         self.dial.create_window(self.dial.xm + 83, self.dial.ym + 30, window=self.dial.digitframe)
+        # Digits change color once the value reaches the redline
+        self._redzone = self.dial.min + 3.0 / 4 * (self.dial.max - self.dial.min)
+        self._last_red = None
 
         # Test/Pause button
         self.button = Tkinter.Button(self, text='Test', width=10, command=self.startstop)
         self.button.pack(pady=20)
         self.isrunning = False
+        self.after_id = None
 
     def startstop(self):
         if not self.isrunning:
@@ -426,32 +515,30 @@ class Advanced(Tkinter.Frame):
                 value = self.dial.value + 1
             self.update_value(value)
         else:
-            try:
+            if self.after_id is not None:
                 self.after_cancel(self.after_id)
-            except Exception:
-                pass
+                self.after_id = None
             self.isrunning = False
             self.button.config(text='Test')
 
     def update_value(self, value):
-        self.dial.set_value(value)
+        if value != self.dial.value:
+            self.dial.set_value(value)
+        digits = self.dial.digits
         hundreds = value // 100
-        if hundreds == 0:
-            self.dial.digits[0].set_value(None)
-        else:
-            self.dial.digits[0].set_value(hundreds)
         tens = value % 100 // 10
-        if tens == 0 and hundreds == 0:
-            self.dial.digits[1].set_value(None)
-        else:
-            self.dial.digits[1].set_value(tens)
-        ones = int(round(value % 10))
-        self.dial.digits[2].set_value(ones)
-        redzone = self.dial.min + 3.0 / 4 * (self.dial.max - self.dial.min)
-        fg = self.dial.displaycolor[value < redzone]
-        bg = self.dial.displaycolor[value >= redzone]
-        for dialdigit in self.dial.digits:
-            dialdigit.change_color(fg, bg)
+        ones = int(value) % 10  # value steps by 1 from an integer start
+        # leading zeros are blanked; only digits whose value changed are redrawn
+        for dialdigit, digitvalue in zip(digits, [hundreds or None, tens if tens or hundreds else None, ones]):
+            if dialdigit.value != digitvalue:
+                dialdigit.set_value(digitvalue)
+        in_red = value >= self._redzone
+        if in_red != self._last_red:  # only recolor when crossing the redline
+            fg = self.dial.displaycolor[not in_red]
+            bg = self.dial.displaycolor[in_red]
+            for dialdigit in digits:
+                dialdigit.change_color(fg, bg)
+            self._last_red = in_red
         if value < self.dial.max:
             self.after_id = self.after(100, self.update_value, value + 1)
         else:
@@ -473,20 +560,19 @@ if __name__ == '__main__':
 
     tabs = Notebook(TestWindow)
     tabs.pack(fill='both', expand=1)
-    tabframes = []
-
-    # Add tests
-    tabframes.append(Introduction(TestWindow))
-    tabframes.append(Construction(TestWindow))
-    tabframes.append(SizeCasewidthValue(TestWindow))
-    tabframes.append(StartExtentMinMax(TestWindow))
-    tabframes.append(ScaleUnit(TestWindow))
-    tabframes.append(BoundWithdisplay(TestWindow))
-    tabframes.append(Demonstration(TestWindow))
-    tabframes.append(Advanced(TestWindow))
-
-    for tabframe in tabframes:
-        tabs.add(tabframe, text=tabframe.title)
+    tabclasses = [Introduction, Construction, SizeCasewidthValue, StartExtentMinMax, ScaleUnit, BoundWithdisplay,
+                  Demonstration, Advanced]
+
+    def buildtab(event):
+        """Builds a test inside its placeholder tab the first time the tab is selected"""
+        placeholder = tabs.nametowidget(tabs.select())
+        if not placeholder.winfo_children():
+            tabclasses[tabs.index(placeholder)](placeholder).pack(fill='both', expand=1)
+
+    # Add tests (as empty placeholders; constructing every Dial up front made startup slow)
+    tabs.bind('<<NotebookTabChanged>>', buildtab)
+    for tabclass in tabclasses:
+        tabs.add(Tkinter.Frame(TestWindow), text=tabclass.title)
 
     # Make Window viewable
     TestWindow.focus_set()
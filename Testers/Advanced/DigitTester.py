@@ -8,6 +8,7 @@
 
 import warnings
 import time
+import ast
 import Tkinter
 from ttk import Notebook
 
@@ -15,13 +16,24 @@ from viewidget import Digit, LED
 
 import CommonTestTools as Ctt
 
+_RGB_CACHE = {}  # '#rrrrggggbbbb' strings keyed by the color text they were resolved from
+# Segment masks for the clock digits, indexed by decimal digit
+_SEGMENT_MASKS = [Digit.Masks[i] for i in range(10)]
+
+# Name, signature and indented docstring of Digit.__init__ for the Construction tab; fixed once the module is imported
+_tab = '\t'.expandtabs(4)
+CONSTRUCTION_NAME = Digit.__name__ + '.__init__'
+CONSTRUCTION_DOC = '\n'.join([Ctt.getfunctionsignature(Digit.__init__),
+                              _tab + Ctt.getdoc(Digit.__init__).replace('\n', '\n' + _tab)])
+
 
 class Introduction(Tkinter.Frame):
     """Provides an introduction from Digit's docstring"""
 
+    title = 'Introduction\n'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Introduction\n'
         innerframe = Tkinter.Frame(self)
         widget = Digit(innerframe)
         widget.pack(side='right')
@@ -37,20 +49,16 @@ class Introduction(Tkinter.Frame):
 class Construction(Tkinter.Frame):
     """Provides information on Digit's __init__ function"""
 
+    title = 'Construction\n'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Construction\n'
         innerframe = Tkinter.Frame(self)
         widget = Digit(innerframe, size=115, value=8, fg='green')
         widget.pack(side='right')
         docframe = Tkinter.Frame(innerframe)
-        name = Ctt.getwidgetname(widget) + ".__init__"
-        sig = Ctt.getfunctionsignature(widget.__init__)
-        doc = Ctt.getdoc(widget.__init__)
-        t = '\t'.expandtabs(4)
-        doc = t + doc.replace('\n', '\n' + t)
-        Tkinter.Label(docframe, text=name, font=('Helvetica', 16, 'bold')).pack(side='top', pady=2)
-        Tkinter.Label(docframe, text='\n'.join([sig, doc]), justify='left').pack(side='bottom')
+        Tkinter.Label(docframe, text=CONSTRUCTION_NAME, font=('Helvetica', 16, 'bold')).pack(side='top', pady=2)
+        Tkinter.Label(docframe, text=CONSTRUCTION_DOC, justify='left').pack(side='bottom')
         docframe.pack(side='left')
         innerframe.pack(side='left', fill='x', expand=1, padx=50)
 
@@ -58,9 +66,10 @@ class Construction(Tkinter.Frame):
 class SizeValue(Tkinter.Frame):
     """Demonstrates Digit configuration functionality: size and value"""
 
+    title = 'size and\nvalue'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'size and\nvalue'
 
         widget1 = Digit()  # Default: size=100, value=0
         widget2 = Digit(value=None)
@@ -86,9 +95,10 @@ class SizeValue(Tkinter.Frame):
 class ForegroundBackground(Tkinter.Frame):
     """Demonstrates Digit configuration functionality: foreground and background"""
 
+    title = 'foreground and\nbackground'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'foreground and\nbackground'
         bg_color = 'SystemMenu'
 
         widget1 = Digit(value=8)  # Default: foreground='red', background='black'
@@ -119,9 +129,10 @@ class ForegroundBackground(Tkinter.Frame):
 class SetMasks(Tkinter.Frame):
     """Demonstrates Digit's low-level set_mask function"""
 
+    title = 'Setting\nmasks'
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Setting\nmasks'
 
         currentmask = 0b1111111
         self.digit = Digit(self, size=200)
@@ -136,25 +147,29 @@ class SetMasks(Tkinter.Frame):
 
         self.choiceframe = Tkinter.Frame(self.maskframe)
         self.choiceframe.pack(anchor='w')
-        self.masks = []
-        for i in range(7):
-            self.masks.append(Tkinter.IntVar())
-            cbutton = Tkinter.Checkbutton(self.choiceframe, text='mask %i' % i, variable=self.masks[i],
+        self.masks = []  # mask 6 (most significant bit) first
+        for i in range(6, -1, -1):
+            mask = Tkinter.IntVar()
+            self.masks.append(mask)
+            cbutton = Tkinter.Checkbutton(self.choiceframe, text='mask %i' % i, variable=mask,
                                           command=self.updatemasks)
             cbutton.select()
             cbutton.config(takefocus=False)
-            cbutton.pack(side='bottom')
-        self.masks.reverse()
+            cbutton.pack(side='top')
 
     def updatemasks(self):
-        currentmask = '0b%i%i%i%i%i%i%i' % tuple([mask.get() for mask in self.masks])
-        self.digit.set_mask(eval(currentmask))
-        self.binlabel.config(text='mask value: ' + currentmask)
+        currentmask = 0
+        for mask in self.masks:
+            currentmask = currentmask << 1 | mask.get()
+        self.digit.set_mask(currentmask)
+        self.binlabel.config(text='mask value: 0b' + format(currentmask, '07b'))
 
 
 class Demonstration(Tkinter.Frame):
     """Allows the user to try out the Digit's features interactively"""
 
+    title = 'Interactive\nDemonstration'
+
     DEFAULT_CONFIG = dict(size=100,
                           value=0,
                           background='black',
@@ -162,10 +177,15 @@ class Demonstration(Tkinter.Frame):
 
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Interactive\nDemonstration'
         self.digit_config = Demonstration.DEFAULT_CONFIG.copy()
         self.digit = Digit(self, **self.digit_config)
         self.digit.pack(side='left', fill='y', expand=1, pady=30)
+        # Config the Digit was built from and the entries its warnings flagged; the Digit is kept (hidden) on errors
+        self._last_config = self.digit_config.copy()
+        self._warnkeys = set()
+        # Shown in place of the Digit on bad input; built on the first error and reused after that
+        self._errordisplay = None
+        self._showingerror = False
 
         # Interact subframe
         self.interactframe = Tkinter.Frame(self)
@@ -173,6 +193,7 @@ class Demonstration(Tkinter.Frame):
         Tkinter.Label(self.interactframe, text="Please enter Digit options...*").pack(anchor='w', pady=5)
         # Entry frame contains config variable keys as labels and corresponding entry widgets with values of each key
         self.entryframe = Tkinter.Frame(self.interactframe)
+        self._entries = {}
         row = 0
         for key, value in self.digit_config.items():
             Tkinter.Label(self.entryframe, text=key).grid(row=row, column=0)
@@ -180,6 +201,7 @@ class Demonstration(Tkinter.Frame):
             ent.insert(0, str(value))
             ent.bind('<Return>', lambda e: self.refresh())
             ent.grid(row=row, column=1)
+            self._entries[key] = ent
             row += 1
         self.entryframe.pack()
         # Reset buttons
@@ -194,66 +216,114 @@ class Demonstration(Tkinter.Frame):
         # Parse config inputs (catch input eval errors)
         haserror = False
         for key in self.digit_config:
-            input = self.entryframe.nametowidget(key).get()
+            ent = self._entries[key]
+            input = ent.get()
             if key in ['foreground', 'fg', 'background', 'bg']:
                 # Config options that takes text: colors - convert to RGB first
                 try:
-                    self.digit_config[key] = "#%04x%04x%04x" % self.winfo_rgb(input)
+                    self.digit_config[key] = self.tohex(input)
                 except Exception, error:
                     haserror = True
-                    self.entryframe.nametowidget(key).config(bg='red')
+                    ent.config(bg='red')
                 else:
-                    self.entryframe.nametowidget(key).config(bg='white')
+                    ent.config(bg='white')
             elif key == 'value':
                 try:
-                    self.digit_config[key] = eval(input)
+                    self.digit_config[key] = ast.literal_eval(input)
                 except Exception:
                     self.digit_config[key] = input
             else:
                 try:
-                    self.digit_config[key] = eval(input)
+                    self.digit_config[key] = ast.literal_eval(input)
                 except Exception, error:
                     haserror = True
-                    self.entryframe.nametowidget(key).config(bg='red')
+                    ent.config(bg='red')
                 else:
-                    self.entryframe.nametowidget(key).config(bg='white')
+                    ent.config(bg='white')
+
+        if haserror:
+            self.show_error(error)
+            return
+
+        # Reuse the current Digit if only its value and/or colors changed
+        if self._last_config is not None:
+            changed = set(key for key in self.digit_config if self.digit_config[key] != self._last_config[key])
+            value = self.digit_config['value']
+            try:
+                known = value is None or value in Digit.Masks
+            except TypeError:  # unhashable input; let the Digit constructor report it
+                known = False
+            if changed <= {'value', 'foreground', 'background'} and known:
+                if 'value' in changed:
+                    self.digit.set_value(value)
+                if 'foreground' in changed or 'background' in changed:
+                    self.digit.change_color(self.digit_config['foreground'] if 'foreground' in changed else None,
+                                            self.digit_config['background'] if 'background' in changed else None)
+                # warnings drawn on the Digit still apply, so keep their entries flagged
+                for key in self._warnkeys:
+                    self._entries[key].config(bg='gold')
+                self._last_config = self.digit_config.copy()
+                if self._showingerror:
+                    self.show_digit()
+                return
 
         # Draw new Digit (catch Digit constructor errors and warnings)
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter("always")
+            try:
+                digit = Digit(self, **self.digit_config)
+            except Exception, error:
+                self.show_error(error)
+                for key in set(str(error).split()).intersection(self.digit_config):
+                    self._entries[key].config(bg='red')
+                return
         self.digit.destroy()
-        if haserror:
-            size = Demonstration.DEFAULT_CONFIG['size']
-            self.digit = Ctt.ErrorDisplay(self, size, error)
+        self.digit = digit
+        self._last_config = self.digit_config.copy()
+        self._warnkeys = set()
+        if warns:
+            # One text item for all warnings, latest on top; Tk wraps the lines itself
+            warn_messages = [str(warn.message) for warn in warns]
+            warn_text = '\n'.join('WARNING: ' + message for message in reversed(warn_messages))
+            size = self.digit_config['size']
+            self.digit.create_text(size / 2, size, text=warn_text, fill='gold', width=size, anchor='s')
+            for key in set(' '.join(warn_messages).split()).intersection(self.digit_config):
+                self._entries[key].config(bg='gold')
+                self._warnkeys.add(key)
+        self.show_digit()
+
+    # end refresh
+
+    def show_error(self, error):
+        """Hides the Digit behind the error display, which is only built the first time it is needed"""
+        if self._errordisplay is None:
+            self._errordisplay = Ctt.ErrorDisplay(self, Demonstration.DEFAULT_CONFIG['size'], error)
         else:
-            with warnings.catch_warnings(record=True) as warns:
-                warnings.simplefilter("always")
-                try:
-                    self.digit = Digit(self, **self.digit_config)
-                except Exception, error:
-                    haserror = True
-                    size = Demonstration.DEFAULT_CONFIG['size']
-                    self.digit = Ctt.ErrorDisplay(self, size, error)
-                    for key in self.digit_config:
-                        if any(key == word for word in str(error).split(' ')):
-                            self.entryframe.nametowidget(key).config(bg='red')
-                else:
-                    offset = 0
-                    for warn in warns:
-                        warn_message = str(warn.message)
-                        warn_text = 'WARNING: ' + warn_message
-                        size = self.digit_config['size']
-                        self.digit.create_text(size / 2, size - offset, text=warn_text, fill='gold', width=size)
-                        offset += 10 * (Ctt.gettextwidth(warn_text) // size + 2)
-                        for key in self.digit_config:
-                            if any(key == word for word in warn_message.split(' ')):
-                                self.entryframe.nametowidget(key).config(bg='gold')
+            self._errordisplay.set_error(error)
+        if not self._showingerror:
+            self.digit.pack_forget()
+            self._errordisplay.pack(side='left', fill='y', expand=1, pady=30)
+            self._showingerror = True
+
+    def show_digit(self):
+        """Packs the Digit, taking down the error display if it is up"""
+        if self._showingerror:
+            self._errordisplay.pack_forget()
+            self._showingerror = False
         self.digit.pack(side='left', fill='y', expand=1, pady=30)
 
-    # end refresh
+    def tohex(self, color):
+        """Resolves a Tk color name to '#rrrrggggbbbb'; each name only goes through winfo_rgb once"""
+        try:
+            return _RGB_CACHE[color]
+        except KeyError:
+            hexcolor = _RGB_CACHE[color] = "#%04x%04x%04x" % self.winfo_rgb(color)
+            return hexcolor
 
     def reset(self):
         """Resets back to the default configuration"""
         for key, value in Demonstration.DEFAULT_CONFIG.items():
-            ent = self.entryframe.nametowidget(key)
+            ent = self._entries[key]
             ent.delete(0, Tkinter.END)
             ent.insert(0, str(value))
         self.refresh()
@@ -262,12 +332,13 @@ class Demonstration(Tkinter.Frame):
 class Advanced(Tkinter.Frame):
     """Demonstrates the use of multiple coordinated Digits"""
 
+    title = 'Advanced\nDesign'
+
     FOREGROUND = 'black'
     MASKPATTERN = [0, 3, 5, 1, 4, 2]
 
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
-        self.title = 'Advanced\nDesign'
         self.BACKGROUND = self.cget('bg')
 
         top_frame = Tkinter.Frame(self)
@@ -275,7 +346,7 @@ class Advanced(Tkinter.Frame):
         # spinning Digit
         self.digit = Digit(top_frame, size=65, value=None)
         self.digit.grid(row=0, column=0, padx=10)
-        self.update_digit(self.MASKPATTERN[0])
+        self._spin_index = 0  # position in MASKPATTERN of the next segment to light
         # message
         msg = "Below is an array of digits performing their quintessential role: A digital clock."
         Tkinter.Label(top_frame, text=msg, justify='left').grid(row=0, column=1)
@@ -306,54 +377,52 @@ class Advanced(Tkinter.Frame):
         self.am_pm.grid(row=0, column=0, ipady=1)
         Tkinter.Label(ledframe, text="PM").grid(row=0, column=1)
 
-        self.H, self.M, self.S = None, None, None
+        self.H, self.M = None, None
+        self._last_sec = None  # epoch second last shown on the clock
+        self._colon_on = True  # colon ovals are drawn in the foreground color
+        self.tick()
+
+    def tick(self):
+        """Single timer for the tab: steps the spinning Digit and refreshes the clock"""
+        self.update_digit()
         self.update_time()
+        # wake up on the next half-second boundary so the ticks do not drift
+        self.after(500 - int(time.time() * 1000) % 500, self.tick)
 
-    def update_digit(self, next_mask):
-        self.digit.set_mask(0)
-        self.digit.set_mask(2 ** next_mask)
-        i = self.MASKPATTERN.index(next_mask) + 1
-        if i == len(self.MASKPATTERN):
-            i = 0
-        self.after(500, self.update_digit, self.MASKPATTERN[i])
+    def update_digit(self):
+        self.digit.set_mask(1 << self.MASKPATTERN[self._spin_index])
+        self._spin_index = (self._spin_index + 1) % len(self.MASKPATTERN)
 
     def update_time(self):
-        H, M, S = time.strftime('%H:%M:%S').split(':')
-        hours = int(H)
-        if hours == 0:
-            H = '12'
-        elif hours > 12:
-            H = str(hours - 12)
-        else:
-            H = str(hours)
-
-        if H != self.H:  # The hour has changed
+        now = int(time.time())
+        if now != self._last_sec:  # nothing on the clock changes until the next second
+            self._last_sec = now
+            self.show_time(now)
+
+    def show_time(self, now):
+        hours, minutes = time.localtime(now)[3:5]
+        if hours != self.H:  # The hour has changed
             # Turn on or off the LED if not in the correct state
             if hours >= 12 and not self.am_pm.state:
                 self.am_pm.turnon()
-            elif not hours < 12 and self.am_pm.state:
+            elif hours < 12 and self.am_pm.state:
                 self.am_pm.turnoff()
-            # Update hour digits
-            if len(H) == 2:
-                self.digits[0].set_value(H[0])
-                self.digits[1].set_value(H[1])
-            else:
-                self.digits[0].set_value(None)
-                self.digits[1].set_value(H[0])
-            self.H = H
-        if M != self.M:
+            # Update hour digits (12-hour clock; the tens digit is blank below 10)
+            tens, ones = divmod(hours % 12 or 12, 10)
+            self.digits[0].set_mask(_SEGMENT_MASKS[tens] if tens else 0)
+            self.digits[1].set_mask(_SEGMENT_MASKS[ones])
+            self.H = hours
+        if minutes != self.M:
             # update minute digits
-            self.digits[2].set_value(M[0])
-            self.digits[3].set_value(M[1])
-            self.M = M
-        if S != self.S:
-            # blink colon
-            if int(S) % 2:
-                self.colon.itemconfig('colon', fill=self.BACKGROUND)
-            else:
-                self.colon.itemconfig('colon', fill=self.FOREGROUND)
-            self.S = S
-        self.after(200, self.update_time)
+            tens, ones = divmod(minutes, 10)
+            self.digits[2].set_mask(_SEGMENT_MASKS[tens])
+            self.digits[3].set_mask(_SEGMENT_MASKS[ones])
+            self.M = minutes
+        # blink colon: shown on even seconds, hidden on odd ones
+        colon_on = not now & 1
+        if colon_on != self._colon_on:
+            self.colon.itemconfig('colon', fill=self.FOREGROUND if colon_on else self.BACKGROUND)
+            self._colon_on = colon_on
 
 
 if __name__ == '__main__':
@@ -371,19 +440,18 @@ if __name__ == '__main__':
 
     tabs = Notebook(TestWindow)
     tabs.pack(fill='both', expand=1)
-    tabframes = []
-
-    # Add tests
-    tabframes.append(Introduction(TestWindow))
-    tabframes.append(Construction(TestWindow))
-    tabframes.append(SizeValue(TestWindow))
-    tabframes.append(ForegroundBackground(TestWindow))
-    tabframes.append(SetMasks(TestWindow))
-    tabframes.append(Demonstration(TestWindow))
-    tabframes.append(Advanced(TestWindow))
-
-    for tabframe in tabframes:
-        tabs.add(tabframe, text=tabframe.title)
+    tabclasses = [Introduction, Construction, SizeValue, ForegroundBackground, SetMasks, Demonstration, Advanced]
+
+    def buildtab(event):
+        """Builds a test inside its placeholder tab the first time the tab is selected"""
+        placeholder = tabs.nametowidget(tabs.select())
+        if not placeholder.winfo_children():
+            tabclasses[tabs.index(placeholder)](placeholder).pack(fill='both', expand=1)
+
+    # Add tests (as empty placeholders; constructing every Digit up front made startup slow)
+    tabs.bind('<<NotebookTabChanged>>', buildtab)
+    for tabclass in tabclasses:
+        tabs.add(Tkinter.Frame(TestWindow), text=tabclass.title)
 
     # Make Window viewable
     TestWindow.focus_set()
@@ -15,6 +15,79 @@ from viewidget import LED
 
 import CommonTestTools as Ctt
 
+_RGB_CACHE = {}  # '#rrrrggggbbbb' strings keyed by the color text they were resolved from
+
+
+def parse_number(text):
+    """Converts entry text to an int, or a float if it is not a whole number"""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_int(text):
+    """Converts entry text to an int; accepts 0b/0o/0x prefixed literals such as 0b111"""
+    return int(text, 0)
+
+
+# Binary strings of every reflectstyle value (3 flag bits), as shown in the tabs and entries
+_BINSTR = dict((i, bin(i)) for i in range(8))
+
+# (LED constructor arguments, options listed next to the LED) for each LED shown on the configuration tabs
+_SIZECASEWIDTH = (
+    (dict(), dict(size=100, casewidth=10)),  # Default values
+    (dict(size=150, casewidth=10), dict(size=150, casewidth=10)),
+    (dict(size=100, casewidth=5), dict(size=100, casewidth=5)),
+    (dict(size=50, casewidth=5), dict(size=50, casewidth=5)),
+)
+_STATECOLOR = (
+    (dict(), dict(state=False, diodecolor='white', bulbcolor='white')),  # Default values
+    (dict(state=True), dict(state=True, diodecolor='white', bulbcolor='white')),
+    (dict(diodecolor='cyan'), dict(state=False, diodecolor='cyan', bulbcolor='white')),
+    (dict(state=True, diodecolor='cyan'), dict(state=True, diodecolor='cyan', bulbcolor='white')),
+    (dict(bulbcolor='cyan'), dict(state=False, diodecolor='white', bulbcolor='cyan')),
+    (dict(state=True, bulbcolor='cyan'), dict(state=True, diodecolor='white', bulbcolor='cyan')),
+    (dict(diodecolor='yellow', bulbcolor='cyan'), dict(state=False, diodecolor='yellow', bulbcolor='cyan')),
+    (dict(state=True, diodecolor='yellow', bulbcolor='cyan'), dict(state=True, diodecolor='yellow', bulbcolor='cyan')),
+)
+_REFLECTSTYLE = (
+    (dict(diodecolor='blue'),  # Default: reflectstyle=0b111
+     dict(state=False, diodecolor='blue', bulbcolor='white', reflectstyle=_BINSTR[7])),
+    (dict(diodecolor='blue', state=True),
+     dict(state=True, diodecolor='blue', bulbcolor='white', reflectstyle=_BINSTR[7])),
+    (dict(bulbcolor='blue'),
+     dict(state=False, diodecolor='white', bulbcolor='blue', reflectstyle=_BINSTR[7])),
+    (dict(bulbcolor='blue', state=True),
+     dict(state=True, diodecolor='white', bulbcolor='blue', reflectstyle=_BINSTR[7])),
+    (dict(bulbcolor='blue', reflectstyle=1),
+     dict(state=False, diodecolor='white', bulbcolor='blue', reflectstyle=_BINSTR[1])),
+    (dict(bulbcolor='blue', reflectstyle=1, state=True),
+     dict(state=True, diodecolor='white', bulbcolor='blue', reflectstyle=_BINSTR[1])),
+    (dict(bulbcolor='#0000ff', reflectstyle=0),
+     dict(state=False, diodecolor='#ffffff', bulbcolor='#0000ff', reflectstyle=_BINSTR[0])),
+    (dict(bulbcolor='#0000FF', reflectstyle=0, state=True),
+     dict(state=True, diodecolor='#FFFFFF', bulbcolor='#0000FF', reflectstyle=_BINSTR[0])),
+)
+_REFLECTFADEBLINK = (
+    (dict(diodecolor='red', state=True),  # Default: reflectstyle=0b111, faderate=0, blinkrate=0
+     dict(diodecolor='red', bulbcolor='white', reflectstyle=_BINSTR[7], faderate=0, blinkrate=0)),
+    (dict(diodecolor='red', state=True, blinkrate=1000),
+     dict(diodecolor='red', bulbcolor='white', reflectstyle=_BINSTR[7], faderate=0, blinkrate=1000)),
+    (dict(bulbcolor='red', state=True, blinkrate=2000),
+     dict(diodecolor='white', bulbcolor='red', reflectstyle=_BINSTR[7], faderate=0, blinkrate=2000)),
+    (dict(bulbcolor='red', state=True, blinkrate=2000, faderate=1000),
+     dict(diodecolor='white', bulbcolor='red', reflectstyle=_BINSTR[7], faderate=1000, blinkrate=2000)),
+    (dict(bulbcolor='red', state=True, blinkrate=3500, faderate=3000),
+     dict(diodecolor='white', bulbcolor='red', reflectstyle=_BINSTR[7], faderate=3000, blinkrate=3500)),
+    (dict(bulbcolor='red', state=True, blinkrate=3500, faderate=3000, reflectstyle=3),
+     dict(diodecolor='white', bulbcolor='red', reflectstyle=_BINSTR[3], faderate=3000, blinkrate=3500)),
+    (dict(bulbcolor='#ff0000', state=True, blinkrate=3500, faderate=3000, reflectstyle=1),
+     dict(diodecolor='#ffffff', bulbcolor='#ff0000', reflectstyle=_BINSTR[1], faderate=3000, blinkrate=3500)),
+    (dict(bulbcolor='#FF0000', state=True, blinkrate=3500, faderate=3000, reflectstyle=0),
+     dict(diodecolor='#FFFFFF', bulbcolor='#FF0000', reflectstyle=_BINSTR[0], faderate=3000, blinkrate=3500)),
+)
+
 
 class Introduction(Tkinter.Frame):
     """Provides an introduction from LED's docstring"""
@@ -62,16 +135,8 @@ class SizeCasewidth(Tkinter.Frame):
         Tkinter.Frame.__init__(self, master)
         self.title = 'size and\ncasewidth'
 
-        widget1 = LED()  # Default: size=100, casewidth=10
-        widget2 = LED(size=150, casewidth=10)
-        widget3 = LED(size=100, casewidth=5)
-        widget4 = LED(size=50, casewidth=5)
-
-        block1 = Ctt.WidgetData(widget1, size=100, casewidth=10)
-        block2 = Ctt.WidgetData(widget2, size=150, casewidth=10)
-        block3 = Ctt.WidgetData(widget3, size=100, casewidth=5)
-        block4 = Ctt.WidgetData(widget4, size=50, casewidth=5)
-        Ctt.WidgetBlock(self, block1, block2, block3, block4).pack(fill='both', expand=1)
+        blocks = [Ctt.WidgetData(LED(**config), **data) for config, data in _SIZECASEWIDTH]
+        Ctt.WidgetBlock(self, *blocks).pack(fill='both', expand=1)
 
 
 class StateColor(Tkinter.Frame):
@@ -81,25 +146,8 @@ class StateColor(Tkinter.Frame):
         Tkinter.Frame.__init__(self, master)
         self.title = 'state, diodecolor\nand bulbcolor'
 
-        widget1 = LED()  # Default: state=False, diodecolor='white', bulbcolor='white'
-        widget2 = LED(state=True)
-        widget3 = LED(diodecolor='cyan')
-        widget4 = LED(state=True, diodecolor='cyan')
-        widget5 = LED(bulbcolor='cyan')
-        widget6 = LED(state=True, bulbcolor='cyan')
-        widget7 = LED(diodecolor='yellow', bulbcolor='cyan')
-        widget8 = LED(state=True, diodecolor='yellow', bulbcolor='cyan')
-
-        block1 = Ctt.WidgetData(widget1, state=False, diodecolor='white', bulbcolor='white')
-        block2 = Ctt.WidgetData(widget2, state=True, diodecolor='white', bulbcolor='white')
-        block3 = Ctt.WidgetData(widget3, state=False, diodecolor='cyan', bulbcolor='white')
-        block4 = Ctt.WidgetData(widget4, state=True, diodecolor='cyan', bulbcolor='white')
-        block5 = Ctt.WidgetData(widget5, state=False, diodecolor='white', bulbcolor='cyan')
-        block6 = Ctt.WidgetData(widget6, state=True, diodecolor='white', bulbcolor='cyan')
-        block7 = Ctt.WidgetData(widget7, state=False, diodecolor='yellow', bulbcolor='cyan')
-        block8 = Ctt.WidgetData(widget8, state=True, diodecolor='yellow', bulbcolor='cyan')
-        Ctt.WidgetBlock(self, block1, block2, block3, block4, block5, block6, block7, block8).pack(fill='both',
-                                                                                                   expand=1)
+        blocks = [Ctt.WidgetData(LED(**config), **data) for config, data in _STATECOLOR]
+        Ctt.WidgetBlock(self, *blocks).pack(fill='both', expand=1)
 
 
 class Reflectstyle(Tkinter.Frame):
@@ -109,25 +157,8 @@ class Reflectstyle(Tkinter.Frame):
         Tkinter.Frame.__init__(self, master)
         self.title = 'reflectstyle\n(steadystate)'
 
-        widget1 = LED(diodecolor='blue')  # Default: reflectstyle=0b111
-        widget2 = LED(diodecolor='blue', state=True)
-        widget3 = LED(bulbcolor='blue')
-        widget4 = LED(bulbcolor='blue', state=True)
-        widget5 = LED(bulbcolor='blue', reflectstyle=1)
-        widget6 = LED(bulbcolor='blue', reflectstyle=1, state=True)
-        widget7 = LED(bulbcolor='#0000ff', reflectstyle=0)
-        widget8 = LED(bulbcolor='#0000FF', reflectstyle=0, state=True)
-
-        block1 = Ctt.WidgetData(widget1, state=False, diodecolor='blue', bulbcolor='white', reflectstyle=bin(7))
-        block2 = Ctt.WidgetData(widget2, state=True, diodecolor='blue', bulbcolor='white', reflectstyle=bin(7))
-        block3 = Ctt.WidgetData(widget3, state=False, diodecolor='white', bulbcolor='blue', reflectstyle=bin(7))
-        block4 = Ctt.WidgetData(widget4, state=True, diodecolor='white', bulbcolor='blue', reflectstyle=bin(7))
-        block5 = Ctt.WidgetData(widget5, state=False, diodecolor='white', bulbcolor='blue', reflectstyle=bin(1))
-        block6 = Ctt.WidgetData(widget6, state=True, diodecolor='white', bulbcolor='blue', reflectstyle=bin(1))
-        block7 = Ctt.WidgetData(widget7, state=False, diodecolor='#ffffff', bulbcolor='#0000ff', reflectstyle=bin(0))
-        block8 = Ctt.WidgetData(widget8, state=True, diodecolor='#FFFFFF', bulbcolor='#0000FF', reflectstyle=bin(0))
-        Ctt.WidgetBlock(self, block1, block2, block3, block4, block5, block6, block7, block8).pack(fill='both',
-                                                                                                   expand=1)
+        blocks = [Ctt.WidgetData(LED(**config), **data) for config, data in _REFLECTSTYLE]
+        Ctt.WidgetBlock(self, *blocks).pack(fill='both', expand=1)
 
 
 class ReflectFadeBlink(Tkinter.Frame):
@@ -137,33 +168,8 @@ class ReflectFadeBlink(Tkinter.Frame):
         Tkinter.Frame.__init__(self, master)
         self.title = 'reflectstyle (transient),\nfaderate and blinkrate'
 
-        widget1 = LED(diodecolor='red', state=True)  # Default: reflectstyle=0b111, faderate=0, blinkrate=0
-        widget2 = LED(diodecolor='red', state=True, blinkrate=1000)
-        widget3 = LED(bulbcolor='red', state=True, blinkrate=2000)
-        widget4 = LED(bulbcolor='red', state=True, blinkrate=2000, faderate=1000)
-        widget5 = LED(bulbcolor='red', state=True, blinkrate=3500, faderate=3000)
-        widget6 = LED(bulbcolor='red', state=True, blinkrate=3500, faderate=3000, reflectstyle=3)
-        widget7 = LED(bulbcolor='#ff0000', state=True, blinkrate=3500, faderate=3000, reflectstyle=1)
-        widget8 = LED(bulbcolor='#FF0000', state=True, blinkrate=3500, faderate=3000, reflectstyle=0)
-
-        block1 = Ctt.WidgetData(widget1, diodecolor='red', bulbcolor='white', reflectstyle=bin(7), faderate=0,
-                                blinkrate=0)
-        block2 = Ctt.WidgetData(widget2, diodecolor='red', bulbcolor='white', reflectstyle=bin(7), faderate=0,
-                                blinkrate=1000)
-        block3 = Ctt.WidgetData(widget3, diodecolor='white', bulbcolor='red', reflectstyle=bin(7), faderate=0,
-                                blinkrate=2000)
-        block4 = Ctt.WidgetData(widget4, diodecolor='white', bulbcolor='red', reflectstyle=bin(7), faderate=1000,
-                                blinkrate=2000)
-        block5 = Ctt.WidgetData(widget5, diodecolor='white', bulbcolor='red', reflectstyle=bin(7), faderate=3000,
-                                blinkrate=3500)
-        block6 = Ctt.WidgetData(widget6, diodecolor='white', bulbcolor='red', reflectstyle=bin(3), faderate=3000,
-                                blinkrate=3500)
-        block7 = Ctt.WidgetData(widget7, diodecolor='#ffffff', bulbcolor='#ff0000', reflectstyle=bin(1), faderate=3000,
-                                blinkrate=3500)
-        block8 = Ctt.WidgetData(widget8, diodecolor='#FFFFFF', bulbcolor='#FF0000', reflectstyle=bin(0), faderate=3000,
-                                blinkrate=3500)
-        Ctt.WidgetBlock(self, block1, block2, block3, block4, block5, block6, block7, block8).pack(fill='both',
-                                                                                                   expand=1)
+        blocks = [Ctt.WidgetData(LED(**config), **data) for config, data in _REFLECTFADEBLINK]
+        Ctt.WidgetBlock(self, *blocks).pack(fill='both', expand=1)
 
 
 class Brightness(Tkinter.Frame):
@@ -195,6 +201,11 @@ class Demonstration(Tkinter.Frame):
                           bulbcolor='white',
                           reflectstyle=0b111, )
 
+    # Parser for each non-color entry's text
+    PARSERS = dict(size=parse_number,
+                   casewidth=parse_number,
+                   reflectstyle=parse_int)
+
     def __init__(self, master):
         Tkinter.Frame.__init__(self, master)
         self.title = 'Interactive\nDemonstration'
@@ -213,6 +224,10 @@ class Demonstration(Tkinter.Frame):
         self.led2 = LED(self.ledon, **self.leds_config)
         self.led2.turnon()
         self.led2.pack(fill='y', expand=1, anchor='n')
+        # Config the LEDs currently shown were built from (None when showing an error) and the entries flagged by
+        # their warnings
+        self._last_config = self.leds_config.copy()
+        self._warnkeys = set()
 
         # Interact subframe
         self.interactframe = Tkinter.Frame(self)
@@ -220,22 +235,27 @@ class Demonstration(Tkinter.Frame):
         Tkinter.Label(self.interactframe, text="Please enter LED options...*").pack(anchor='w', pady=5)
         # Entry frame contains config variable keys as labels and corresponding entry widgets with values of each key
         self.entryframe = Tkinter.Frame(self.interactframe)
+        self._entries = {}
         row = 0
         for key, value in self.leds_config.items():
             Tkinter.Label(self.entryframe, text=key).grid(row=row, column=0)
             ent = Tkinter.Entry(self.entryframe, name=key)
             if key == 'reflectstyle':
-                ent.insert(0, bin(value))
+                ent.insert(0, _BINSTR[value])
             else:
                 ent.insert(0, str(value))
             ent.bind('<Return>', lambda e: self.refresh())
             ent.grid(row=row, column=1)
+            self._entries[key] = ent
             row += 1
         self.entryframe.pack()
+        # Entry texts the LEDs were last refreshed from
+        self._last_inputs = dict((key, ent.get()) for key, ent in self._entries.items())
         # Reset and animate buttons
         self.animate_button = Tkinter.Button(self.interactframe, text='Animate', width=10,
                                              command=lambda: Animation(self, **self.leds_config))
         self.animate_button.pack(pady=10)
+        self._animate_state = Tkinter.NORMAL  # state last given to the animate button
         Tkinter.Button(self.interactframe, text='Reset', width=10, command=self.reset).pack()
         msg = "*Press <enter> after typing in an option\n value to refresh the LED widget"
         Tkinter.Label(self.interactframe, text=msg, justify='left').pack(anchor='w', pady=10)
@@ -244,31 +264,55 @@ class Demonstration(Tkinter.Frame):
 
     def refresh(self):
         """Reads the inputs from the entry widgets and updates the GUI; includes alerts for errors and warnings"""
+        # Nothing to do if no entry was edited since the last refresh
+        inputs = dict((key, ent.get()) for key, ent in self._entries.items())
+        if inputs == self._last_inputs:
+            return
+        self._last_inputs = inputs
+
         # Parse config inputs (catch input eval errors)
         haserror = False
         for key in self.leds_config:
-            input = self.entryframe.nametowidget(key).get()
+            ent = self._entries[key]
+            input = inputs[key]
             if key == 'diodecolor' or key == 'bulbcolor':
                 # Config options that takes text: colors - convert to RGB first
                 try:
-                    self.leds_config[key] = "#%04x%04x%04x" % self.winfo_rgb(input)
+                    self.leds_config[key] = self.tohex(input)
                 except Exception, error:
                     haserror = True
-                    self.entryframe.nametowidget(key).config(bg='red')
+                    ent.config(bg='red')
                 else:
-                    self.entryframe.nametowidget(key).config(bg='white')
+                    ent.config(bg='white')
             else:
                 try:
-                    self.leds_config[key] = eval(input)
+                    self.leds_config[key] = Demonstration.PARSERS[key](input)
                 except Exception, error:
                     haserror = True
-                    self.entryframe.nametowidget(key).config(bg='red')
+                    ent.config(bg='red')
                 else:
-                    self.entryframe.nametowidget(key).config(bg='white')
+                    ent.config(bg='white')
+
+        # Recolor the current LEDs if nothing besides their colors changed
+        if not haserror and self._last_config is not None:
+            changed = set(key for key in self.leds_config if self.leds_config[key] != self._last_config[key])
+            if changed <= {'diodecolor', 'bulbcolor'}:
+                if changed:
+                    diodecolor = self.leds_config['diodecolor'] if 'diodecolor' in changed else None
+                    bulbcolor = self.leds_config['bulbcolor'] if 'bulbcolor' in changed else None
+                    self.led1.change_color(diodecolor, bulbcolor)
+                    self.led2.change_color(diodecolor, bulbcolor)
+                # warnings drawn on the LED still apply, so keep their entries flagged
+                for key in self._warnkeys:
+                    self._entries[key].config(bg='gold')
+                self._last_config = self.leds_config.copy()
+                return
 
         # Draw new LED (catch LED constructor errors and warnings)
         self.ledoff.destroy()
         self.ledon.destroy()
+        self._last_config = None
+        self._warnkeys = set()
         if haserror:
             size = Demonstration.DEFAULT_CONFIG['size'] * 2
             self.ledoff = Ctt.ErrorDisplay(self.leds_frame, size, error)
@@ -289,36 +333,43 @@ class Demonstration(Tkinter.Frame):
                     size = Demonstration.DEFAULT_CONFIG['size'] * 2
                     self.ledoff = Ctt.ErrorDisplay(self.leds_frame, size, error)
                     self.ledon = Tkinter.Frame(self.leds_frame)
-                    for key in self.leds_config:
-                        if any(key == word for word in str(error).split(' ')):
-                            self.entryframe.nametowidget(key).config(bg='red')
+                    for key in set(str(error).split()).intersection(self.leds_config):
+                        self._entries[key].config(bg='red')
                 else:
-                    offset = 0
-                    warn_messages = {str(warn.message) for warn in warns}
-                    for warn_message in warn_messages:
-                        warn_text = 'WARNING: ' + warn_message
+                    self._last_config = self.leds_config.copy()
+                    if warns:
+                        # One text item for all (distinct) warnings; Tk wraps the lines itself
+                        warn_messages = list({str(warn.message) for warn in warns})
+                        warn_text = '\n'.join('WARNING: ' + message for message in warn_messages)
                         size = self.leds_config['size']
-                        self.led1.create_text(size / 2, size - offset, text=warn_text, fill='gold', width=size)
-                        offset += 10 * (Ctt.gettextwidth(warn_text) // size + 2)
-                        for key in self.leds_config:
-                            if any(key == word for word in warn_message.split(' ')):
-                                self.entryframe.nametowidget(key).config(bg='gold')
+                        self.led1.create_text(size / 2, size, text=warn_text, fill='gold', width=size, anchor='s')
+                        for key in set(' '.join(warn_messages).split()).intersection(self.leds_config):
+                            self._entries[key].config(bg='gold')
+                            self._warnkeys.add(key)
         self.ledoff.pack(fill='y', expand=1)
         self.ledon.pack(fill='y', expand=1)
-        if haserror:
-            self.animate_button.config(state=Tkinter.DISABLED)
-        elif self.animate_button['state'] != 'normal':
-            self.animate_button.config(state=Tkinter.NORMAL)
+        animate_state = Tkinter.DISABLED if haserror else Tkinter.NORMAL
+        if animate_state != self._animate_state:
+            self.animate_button.config(state=animate_state)
+            self._animate_state = animate_state
 
     # end refresh
 
+    def tohex(self, color):
+        """Resolves a Tk color name to '#rrrrggggbbbb'; each name only goes through winfo_rgb once"""
+        try:
+            return _RGB_CACHE[color]
+        except KeyError:
+            hexcolor = _RGB_CACHE[color] = "#%04x%04x%04x" % self.winfo_rgb(color)
+            return hexcolor
+
     def reset(self):
         """Resets back to the default configuration"""
         for key, value in Demonstration.DEFAULT_CONFIG.items():
-            ent = self.entryframe.nametowidget(key)
+            ent = self._entries[key]
             ent.delete(0, Tkinter.END)
             if key == 'reflectstyle':
-                ent.insert(0, bin(value))
+                ent.insert(0, _BINSTR[value])
             else:
                 ent.insert(0, str(value))
         self.refresh()
@@ -353,6 +404,7 @@ class Animation(Tkinter.Toplevel):
         ent.insert(0, str(self.led.faderate))
         ent.bind('<Return>', lambda e: self.set_rates())
         ent.grid(row=0, column=1)
+        self._entries = {name: ent}
         # blinkrate
         name = 'blinkrate'
         Tkinter.Label(self.entryframe, text=name).grid(row=1, column=0)
@@ -360,6 +412,7 @@ class Animation(Tkinter.Toplevel):
         ent.insert(0, str(self.led.blinkrate))
         ent.bind('<Return>', lambda e: self.set_rates())
         ent.grid(row=1, column=1)
+        self._entries[name] = ent
 
         # On button
         button = Tkinter.Button(self, text='On', width=10, command=self.turnon)
@@ -398,23 +451,24 @@ class Animation(Tkinter.Toplevel):
 
     def set_rate(self, key, ratefunc):
         haserror = False
+        ent = self._entries[key]
         # check for input errors
         try:
-            input = eval(self.entryframe.nametowidget(key).get())
+            input = parse_number(ent.get())
         except Exception, error:
             haserror = True
-            self.entryframe.nametowidget(key).config(bg='red')
+            ent.config(bg='red')
         else:
-            self.entryframe.nametowidget(key).config(bg='white')
+            ent.config(bg='white')
         # check for set rate errors, else set rate
         if not haserror:
             try:
                 ratefunc(input)
             except Exception, error:
                 haserror = True
-                self.entryframe.nametowidget(key).config(bg='red')
+                ent.config(bg='red')
             else:
-                self.entryframe.nametowidget(key).config(bg='white')
+                ent.config(bg='white')
         return haserror
 
     def set_rates(self):
@@ -442,10 +496,11 @@ class Advanced(Tkinter.Frame):
         # first blinking LED
         color = self.COLORS[0]
         led = LED(topframe, size=56, casewidth=5, state=LED.ON, diodecolor=color, reflectstyle=5)
+        # fade rate is set after construction so the LED lights instantly instead of fading up at startup
         led.set_faderate(2000)
-        led.diodecolor = color
+        led.colorindex = 0  # position of the LED's current color in COLORS
         led.grid(row=0, column=0)
-        self.update_LED(led)
+        self.blinkers = [led]
         # message
         msg = "The LED can be utilized in various ways and designs.\n"
         msg += "An example of LEDs used as an equalizer display is shown below."
@@ -454,67 +509,68 @@ class Advanced(Tkinter.Frame):
         color = self.COLORS[1]
         led = LED(topframe, size=56, casewidth=5, state=LED.ON, diodecolor=color, reflectstyle=5)
         led.set_faderate(2000)
-        led.diodecolor = color
+        led.colorindex = 1
         led.grid(row=0, column=2)
-        self.after(500, self.update_LED, led)
+        self.blinkers.append(led)
+        self.blinker = 0  # index in blinkers of the LED to toggle next
+        self.update_LEDs()
 
         # Array of LEDs
         self.LEDs = []
         LEDframe = Tkinter.Frame(self)
         LEDframe.pack(padx=10, pady=10)
+        rowcolors = ['red'] * 2 + ['yellow'] * 2 + ['green'] * (self.ROWS - 4)  # top to bottom
         for i in range(self.COLUMNS):
             LEDs = []
             for j in range(self.ROWS):
-                if j < 2:
-                    diodecolor = 'red'
-                elif j < 4:
-                    diodecolor = 'yellow'
-                else:
-                    diodecolor = 'green'
-                led = LED(LEDframe, size=20, casewidth=0, reflectstyle=0, diodecolor=diodecolor)
+                led = LED(LEDframe, size=20, casewidth=0, reflectstyle=0, diodecolor=rowcolors[j])
                 led.grid(row=j, column=i)
                 LEDs.append(led)
             self.LEDs.append(LEDs)
+        self.randint = random.Random().randint  # the equalizer's own generator, bound once
         self.init_array()
 
+    def update_LEDs(self):
+        # one timer for both blinking LEDs: they take turns every 500 ms, so each toggles once a second
+        self.update_LED(self.blinkers[self.blinker])
+        self.blinker ^= 1
+        self.after(500, self.update_LEDs)
+
     def update_LED(self, led):
         if not led.state:
-            i = self.COLORS.index(led.diodecolor) + 1
-            if i < len(self.COLORS):
-                color = self.COLORS[i]
-            else:
-                color = self.COLORS[0]
-            led.change_color(color)
-            led.diodecolor = color
+            led.colorindex = (led.colorindex + 1) % len(self.COLORS)
+            led.change_color(self.COLORS[led.colorindex])
         led.change_state()
-        self.after(1000, self.update_LED, led)
 
     def init_array(self):
-        self.LEDoutput = [random.randint(0, self.ROWS - 1)]
+        self.LEDshown = [0] * self.COLUMNS  # level each column currently displays (all LEDs start off)
+        LEDoutput = self.LEDoutput = [self.randint(0, self.ROWS - 1)]
+        next_output = self.next_output
         for i in range(1, self.COLUMNS):
-            next_output = self.next_output(self.LEDoutput[-1])
-            self.LEDoutput.append(next_output)
+            LEDoutput.append(next_output(LEDoutput[-1]))
         self.update_array()
 
     def update_array(self):
-        for i in range(self.COLUMNS):
-            column_output = self.LEDoutput[i]
-            for j in range(self.ROWS):
-                self.LEDs[i][j].turn(column_output >= self.ROWS - j)
+        ROWS = self.ROWS
+        LEDshown = self.LEDshown
+        for i, column_output in enumerate(self.LEDoutput):
+            shown = LEDshown[i]
+            if column_output != shown:
+                # only the LEDs between the old and new levels change state
+                column = self.LEDs[i]
+                for j in range(ROWS - max(column_output, shown), ROWS - min(column_output, shown)):
+                    column[j].turn(column_output >= ROWS - j)
+                LEDshown[i] = column_output
         self.after(500, self.update_output)
 
     def update_output(self):
-        for i in range(self.COLUMNS):
-            self.LEDoutput[i] = self.next_output(self.LEDoutput[i])
+        next_output = self.next_output
+        self.LEDoutput = [next_output(seed) for seed in self.LEDoutput]
         self.update_array()
 
     def next_output(self, seed):
-        goodval = False
-        while not goodval:
-            next_output = seed + random.randint(-2, 2)
-            if 0 <= next_output <= self.ROWS:
-                goodval = True
-        return next_output
+        # a step of -2..+2 from seed, drawn only from the steps that stay within 0..ROWS
+        return self.randint(max(0, seed - 2), min(self.ROWS, seed + 2))
 
 
 if __name__ == '__main__':
@@ -6,7 +6,10 @@
 #                                     #
 #######################################
 
-import Tkinter
+try:
+    import Tkinter
+except ImportError:  # Python 3 names
+    import tkinter as Tkinter
 from viewidget import Dial
 
 
@@ -27,9 +30,14 @@ TestWindow.dial.pack(side=Tkinter.TOP)
 TestWindow.quitbutton = Tkinter.Button(TestWindow.frame, text='Quit', width=10, command=TestWindow.quit)
 TestWindow.quitbutton.pack(side='bottom', pady=17)
 
-# Set up an event every 150ms to increase the dial by 1 degree
-for i in range(231 - value):
-    TestWindow.after(150 * i, TestWindow.dial.set_value, value + i)
+# Set up an event every 150ms to increase the dial by 1 degree; each event schedules the next one
+def step(i=0):
+    TestWindow.dial.set_value(value + i)
+    if i < 230 - value:
+        TestWindow.after(150, step, i + 1)
+
+
+TestWindow.after(0, step)
 
 # Make Window viewable
 TestWindow.focus_set()
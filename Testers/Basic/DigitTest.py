@@ -6,7 +6,10 @@
 #                                     #
 #######################################
 
-import Tkinter
+try:
+    import Tkinter
+except ImportError:  # Python 3 names
+    import tkinter as Tkinter
 from viewidget import Digit
 
 
@@ -28,9 +31,14 @@ TestWindow.digit2.pack(side=Tkinter.LEFT)
 TestWindow.quitbutton = Tkinter.Button(TestWindow.frame, text='Quit', width=10, command=TestWindow.quit)
 TestWindow.quitbutton.pack(side='bottom', pady=17)
 
-# Set up an event every 1s to increase the digit1 by +1
-for i in range(10):
-    TestWindow.after(i * 1000, TestWindow.digit1.set_value, i)
+# Set up an event every 1s to increase the digit1 by +1; each event schedules the next one
+def step(i=0):
+    TestWindow.digit1.set_value(i)
+    if i < 9:
+        TestWindow.after(1000, step, i + 1)
+
+
+TestWindow.after(0, step)
 
 # Make Window viewable
 TestWindow.focus_set()
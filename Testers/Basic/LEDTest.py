@@ -6,30 +6,52 @@
 #                                     #
 #######################################
 
-import Tkinter
+try:
+    import Tkinter
+    import ttk
+except ImportError:  # Python 3 names
+    import tkinter as Tkinter
+    from tkinter import ttk
 from viewidget import LED
 
 
+class UI(object):
+    """Holds the test widgets, so they are not set as attributes on the Tk root"""
+    __slots__ = ('frame', 'ledframe', 'led', 'quitbutton', 'statebutton')
+
+
 TestWindow = Tkinter.Tk()
+ui = UI()
+TestWindow.withdraw()  # keep the window unmapped until all widgets are packed, so it is laid out once
 TestWindow.title('LED Test')
-TestWindow.geometry('325x300')
-TestWindow.frame = Tkinter.Frame(TestWindow, relief='ridge', borderwidth=2)
-TestWindow.frame.pack(fill='both', expand=1)
+ui.frame = Tkinter.Frame(TestWindow, relief='ridge', borderwidth=2)
+ui.frame.pack(fill='both', expand=1)
+ttk.Style(TestWindow).configure('Tester.TButton', width=10)
 
 # Add LED Viewidget
-TestWindow.ledframe = Tkinter.Frame(TestWindow.frame)
-TestWindow.ledframe.pack(expand=1, fill='x')
-TestWindow.led = LED(TestWindow.ledframe, bulbcolor='green', state=LED.ON, faderate=1000)
-TestWindow.led.pack(side=Tkinter.TOP)
+ui.ledframe = Tkinter.Frame(ui.frame)
+ui.ledframe.pack(expand=1, fill='x')
+ui.led = LED(ui.ledframe, bulbcolor='green', state=LED.ON, faderate=1000)
+ui.led.pack(side=Tkinter.TOP)
 
 # Add quit button
-TestWindow.quitbutton = Tkinter.Button(TestWindow.frame, text='Quit', width=10, command=TestWindow.quit)
-TestWindow.quitbutton.pack(side='bottom', pady=17)
+ui.quitbutton = ttk.Button(ui.frame, text='Quit', style='Tester.TButton', takefocus=False,
+                           command=TestWindow.destroy)
+ui.quitbutton.pack(side='bottom', pady=17)
 
 # Add state button to allow user to turn on or off
-TestWindow.statebutton = Tkinter.Button(TestWindow.frame, text='state', width=10, command=TestWindow.led.change_state)
-TestWindow.statebutton.pack(side='bottom', pady=17)
+ui.statebutton = ttk.Button(ui.frame, text='state', style='Tester.TButton', takefocus=False,
+                            command=ui.led.change_state)
+ui.statebutton.pack(side='bottom', pady=17)
+
+# Keyboard shortcuts: space toggles the LED state, q quits (the buttons take no focus, so space is not also
+# delivered to a focused button's own binding)
+TestWindow.bind('<space>', lambda event: ui.led.change_state())
+TestWindow.bind('<q>', lambda event: TestWindow.destroy())
 
-# Make Window viewable
+# Make Window viewable, sized from the packed widgets rather than a fixed geometry
+TestWindow.update_idletasks()
+TestWindow.minsize(TestWindow.winfo_reqwidth(), TestWindow.winfo_reqheight())
+TestWindow.deiconify()
 TestWindow.focus_set()
 TestWindow.mainloop()
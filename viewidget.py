@@ -45,25 +45,44 @@ Non-widget support objects:
 Support methods in this module:
     - mean(iterable): Math function to calculate the average from an
         iterable set of values. Returns float.
+    - unitcircle(start, step, count): Math function that yields the
+        (cos, sin) of evenly spaced angles, in degrees. Returns generator.
+    - hexcolor(r, g, b): Color function to convert red, green and blue
+        values from 0 to 1 into a Tk color string. Returns string.
 
 """
 
 from __future__ import division
 import warnings
 import math
+import operator
 import Tkinter
 import tkFont
 from time import time
 from collections import deque
 from colorsys import rgb_to_hls, hls_to_rgb
-from cmath import exp as cexp
 
 
 # FUNCTIONS
 # ------------
 def mean(iterable):
     """Returns the average of the values in the iterable."""
-    return math.fsum(iterable) / max(len(iterable), 1)
+    return sum(iterable) / max(len(iterable), 1)
+
+
+def unitcircle(start, step, count):
+    """Yields (cos, sin) of count angles, in degrees, from start in equal steps."""
+    # each point is the previous one rotated by step, so only the first angle and the step need trig calls
+    cos, sin = math.cos(math.radians(start)), math.sin(math.radians(start))
+    stepcos, stepsin = math.cos(math.radians(step)), math.sin(math.radians(step))
+    for n in range(count):
+        yield cos, sin
+        cos, sin = cos * stepcos - sin * stepsin, sin * stepcos + cos * stepsin
+
+
+def hexcolor(r, g, b):
+    """Returns the 16-bit per channel Tk color string of r, g, b values from 0 to 1."""
+    return "#%04x%04x%04x" % (int(r * 65535 + 0.5), int(g * 65535 + 0.5), int(b * 65535 + 0.5))
 
 
 # CLASSES
@@ -98,11 +117,33 @@ class Dial(Tkinter.Canvas):
     the Viewidget Dial contains one fundamental method:
         - set_value(value): Points needle to the value given.
 
+    Note the scale numbering font (scalefont) is shared by all Dials of the
+    same size under one root window, so treat it as read-only; the readout
+    display font (displayfont) belongs to each Dial.
+
     """
 
     # Class Attributes
     # ------------------
     DEGREE = u'\u00B0'  # Degree sign
+    _scalefonts = {}  # root window -> {size: shared scale numbering font}; dropped when the root is destroyed
+    # constructor keywords -> (test the value must pass, error raised if it fails), or None if any value is accepted
+    _kwchecks = {
+        'size': (lambda value: value > 0, 'Dial size must be greater than zero'),
+        'casewidth': (lambda value: value >= 0, 'Dial casewidth must be greater than or equal to zero'),
+        'start': (lambda value: abs(value) < 360, 'Dial start angle must be smaller than +/-360 degrees'),
+        'extent': (lambda value: abs(value) <= 360,
+                   'Dial extent angle must be smaller than or equal to +/-360 degrees'),
+        'min': None,
+        'max': None,
+        'majorscale': (lambda value: value > 0, 'Dial majorscale must be greater than zero'),
+        'semimajorscale': (lambda value: value >= 0, 'Dial semimajorscale must be greater than or equal to zero'),
+        'minorscale': (lambda value: value >= 0, 'Dial minorscale must be greater than or equal to zero'),
+        'unit': None,
+        'value': None,
+        'bound': None,
+        'withdisplay': None,
+    }
 
     # Class Methods
     # ------------------
@@ -138,85 +179,54 @@ class Dial(Tkinter.Canvas):
         self.displaycolor = ['black',
                              'red']  # List of readout display colors (if withdisplay is enabled) [<normal>, <alert>]
         self.displayroundto = 1  # Number to round past the decimal on the readout display (if withdisplay is enabled)
-
-        size = 300  # Size of dial
-        casewidth = 15  # Size of dial case border
-        self.start = 225  # Angle of starting point (from positive x-axis in degrees)
-        extent = -270  # Angle to extend arc from starting point (extends from self.start counter-clockwise in degrees)
-        self.min = 60  # Minimum scale value
-        self.max = 220  # Maximum scale value
-        majorscale = 20  # Step size of major counts on scale (long ticks, with number); Must be greater than zero
-        semimajorscale = 10  # Step size semimajor counts (long ticks, no number); Must be factor of majorscale or zero
-        minorscale = 2  # Step size of minor counts on scale (short ticks, no number); Set to zero to disable
-        unit = None  # Unit value to show on dial (e.g. degC, psi, rpm, etc...)
-        initvalue = None  # Initial value of dial; Defaults to self.min if no value is specified during initialization
-        bound = None  # User set bound flag; Defaults to self.bound if not set; Note bound is turned off if extent >360
-        withdisplay = True  # Flag to turn on dial readout display
+        self.outofbounds = False  # Flag whether the drawn value is past a bound dial's min/max
+        self.drawID = None  # keeps track of the idle after-event ID of a pending needle/readout redraw
+        self.needleangle = 0  # Angle the needle is currently drawn at (in radians); it is created pointing at 0
+        self.displayed = None  # (text, color) currently shown on the readout display
 
         # Parse keyword arguments
         # -----------------------
         for key, value in kwargs.items():
-            if key == 'size':
-                if value > 0:
-                    size = value
-                else:
-                    raise ViewidgetError('Dial size must be greater than zero')
-            elif key == 'casewidth':
-                if value >= 0:
-                    casewidth = value
-                else:
-                    raise ViewidgetError('Dial casewidth must be greater than or equal to zero')
-            elif key == 'start':
-                if abs(value) < 360:
-                    self.start = value
-                else:
-                    raise ViewidgetError('Dial start angle must be smaller than +/-360 degrees')
-            elif key == 'extent':
-                if abs(value) <= 360:
-                    extent = value
-                    if abs(value) == 360:
-                        self.bound = False
-                else:
-                    raise ViewidgetError('Dial extent angle must be smaller than or equal to +/-360 degrees')
-            elif key == 'min':
-                self.min = value
-            elif key == 'max':
-                self.max = value
-            elif key == 'majorscale':
-                if value > 0:
-                    majorscale = value
-                else:
-                    raise ViewidgetError('Dial majorscale must be greater than zero')
-            elif key == 'semimajorscale':
-                if value >= 0:
-                    semimajorscale = value
-                else:
-                    raise ViewidgetError('Dial semimajorscale must be greater than or equal to zero')
-            elif key == 'minorscale':
-                if value >= 0:
-                    minorscale = value
-                else:
-                    raise ViewidgetError('Dial minorscale must be greater than or equal to zero')
-            elif key == 'unit':
-                if type(value) == str:
-                    unit = value.replace('deg', Dial.DEGREE)
-                else:
-                    unit = value
-            elif key == 'value':
-                initvalue = value
-            elif key == 'bound':
-                bound = bool(value)
-            elif key == 'withdisplay':
-                withdisplay = bool(value)
-            else:
+            try:
+                check = Dial._kwchecks[key]
+            except KeyError:
                 raise ViewidgetError('Dial init keyword "%s" unknown' % key)
+            if check and not check[0](value):
+                raise ViewidgetError(check[1])
+
+        size = kwargs.get('size', 300)  # Size of dial
+        casewidth = kwargs.get('casewidth', 15)  # Size of dial case border
+        self.start = kwargs.get('start', 225)  # Angle of starting point (from positive x-axis in degrees)
+        # Angle to extend arc from starting point (extends from self.start counter-clockwise in degrees)
+        extent = kwargs.get('extent', -270)
+        self.min = kwargs.get('min', 60)  # Minimum scale value
+        self.max = kwargs.get('max', 220)  # Maximum scale value
+        # Step size of major counts on scale (long ticks, with number); Must be greater than zero
+        majorscale = kwargs.get('majorscale', 20)
+        # Step size semimajor counts (long ticks, no number); Must be factor of majorscale or zero
+        semimajorscale = kwargs.get('semimajorscale', 10)
+        # Step size of minor counts on scale (short ticks, no number); Set to zero to disable
+        minorscale = kwargs.get('minorscale', 2)
+        unit = kwargs.get('unit')  # Unit value to show on dial (e.g. degC, psi, rpm, etc...)
+        # Initial value of dial; Defaults to self.min if no value is specified during initialization
+        initvalue = kwargs.get('value')
+        withdisplay = bool(kwargs.get('withdisplay', True))  # Flag to turn on dial readout display
+
+        if abs(extent) == 360:
+            self.bound = False
+        if type(unit) == str:
+            unit = unit.replace('deg', Dial.DEGREE)
 
         # Set initial values and check for user input errors
         # --------------------------------------------------
         self.end = self.start + extent
+        # the needle is drawn in radians; start/end are kept in degrees for the scale and the public attributes
+        self.startrad = math.radians(self.start)
+        self.endrad = math.radians(self.end)
 
-        if bound is not None:
-            self.bound = bound
+        # User set bound flag; Defaults to self.bound if not set; Note bound is turned off if extent >360
+        if 'bound' in kwargs:
+            self.bound = bool(kwargs['bound'])
 
         if self.min == self.max:
             raise ViewidgetError('Dial min cannot be equal to the max')
@@ -264,57 +274,63 @@ class Dial(Tkinter.Canvas):
         # -------------------
         absdiff = abs(self.max - self.min)
         arcoffset = dialrad / 3
+        # scale items are collected as one Tcl script and created with a single eval instead of a call per item
+        script = []
+        line = self._w + ' create line %r %r %r %r -width %d -tags {%s}'
+        text = self._w + ' create text %r %r -text {%s} -font {%s} -tags {%s}'
 
         # minor scale ticks
         if minorscale != 0:
-            tags = ('minorscale', 'minorscale_ticks', 'scale_ticks', 'scale')
+            tags = 'minorscale minorscale_ticks scale_ticks scale'
             numoflines = int(absdiff / minorscale) + 1
-            angles = (self.start + n * extent * minorscale / absdiff for n in range(numoflines))
-            for angle in angles:
-                x1 = self.xm + (dialrad - arcoffset) * math.cos(math.radians(angle))
-                y1 = self.ym - (dialrad - arcoffset) * math.sin(math.radians(angle))
-                x2 = x1 + arcoffset / 5 * math.cos(math.radians(angle))
-                y2 = y1 - arcoffset / 5 * math.sin(math.radians(angle))
-                self.create_line(x1, y1, x2, y2, tags=tags)
+            for cos, sin in unitcircle(self.start, extent * minorscale / absdiff, numoflines):
+                x1 = self.xm + (dialrad - arcoffset) * cos
+                y1 = self.ym - (dialrad - arcoffset) * sin
+                x2 = x1 + arcoffset / 5 * cos
+                y2 = y1 - arcoffset / 5 * sin
+                script.append(line % (x1, y1, x2, y2, 1, tags))
 
         # semimajor scale ticks
         if semimajorscale != 0:
-            tags = ('minorscale', 'semimajorscale_ticks', 'scale_ticks', 'scale')
+            tags = 'minorscale semimajorscale_ticks scale_ticks scale'
             numoflines = int(absdiff / semimajorscale) + 1
-            angles = (self.start + n * extent * semimajorscale / absdiff for n in range(numoflines))
-            for angle in angles:
-                x1 = self.xm + (dialrad - arcoffset) * math.cos(math.radians(angle))
-                y1 = self.ym - (dialrad - arcoffset) * math.sin(math.radians(angle))
-                x2 = x1 + arcoffset / 3 * math.cos(math.radians(angle))
-                y2 = y1 - arcoffset / 3 * math.sin(math.radians(angle))
-                self.create_line(x1, y1, x2, y2, tags=tags)
+            for cos, sin in unitcircle(self.start, extent * semimajorscale / absdiff, numoflines):
+                x1 = self.xm + (dialrad - arcoffset) * cos
+                y1 = self.ym - (dialrad - arcoffset) * sin
+                x2 = x1 + arcoffset / 3 * cos
+                y2 = y1 - arcoffset / 3 * sin
+                script.append(line % (x1, y1, x2, y2, 1, tags))
 
         # major scale ticks and numbering
-        tags = ('majorscale', 'majorscale_ticks', 'scale_ticks', 'scale')
+        tags = 'majorscale majorscale_ticks scale_ticks scale'
         numoflines = int(absdiff / majorscale) + int(abs(extent) != 360)
-        angles = (self.start + n * extent * majorscale / absdiff for n in range(numoflines))
-        textvals = (self.min + n * majorscale * count_direction for n in range(numoflines))
+        angles = unitcircle(self.start, extent * majorscale / absdiff, numoflines)
+        textvals = [str(self.min + n * majorscale * count_direction) for n in range(numoflines)]
         textpos = arcoffset / 2.5
-        texttags = ('majorscale', 'scale_text', 'scale')
-        self.scalefont = tkFont.Font(size=int(arcoffset / 5), weight='bold')
-        for angle, textval in zip(angles, textvals):
-            x1 = self.xm + (dialrad - arcoffset) * math.cos(math.radians(angle))
-            y1 = self.ym - (dialrad - arcoffset) * math.sin(math.radians(angle))
-            x2 = x1 + arcoffset / 3 * math.cos(math.radians(angle))
-            y2 = y1 - arcoffset / 3 * math.sin(math.radians(angle))
-            self.create_line(x1, y1, x2, y2, width=3, tags=tags)
-            x1 = self.xm + (dialrad - textpos) * math.cos(math.radians(angle))
-            y1 = self.ym - (dialrad - textpos) * math.sin(math.radians(angle))
-            self.create_text(x1, y1, text=textval, font=self.scalefont, tags=texttags)
+        texttags = 'majorscale scale_text scale'
+        self.scalefont = self._scalefont(int(arcoffset / 5))
+        for (cos, sin), textval in zip(angles, textvals):
+            x1 = self.xm + (dialrad - arcoffset) * cos
+            y1 = self.ym - (dialrad - arcoffset) * sin
+            x2 = x1 + arcoffset / 3 * cos
+            y2 = y1 - arcoffset / 3 * sin
+            script.append(line % (x1, y1, x2, y2, 3, tags))
+            x1 = self.xm + (dialrad - textpos) * cos
+            y1 = self.ym - (dialrad - textpos) * sin
+            script.append(text % (x1, y1, textval, self.scalefont.name, texttags))
+        self.tk.eval('\n'.join(script))
 
         # scale arc
         tags = ('majorscale', 'scale_arc', 'scale')
         x1 = y1 = arcoffset + casewidth
         x2 = y2 = size - arcoffset
-        if abs(extent) != 360:
-            self.create_arc(x1, y1, x2, y2, start=self.start, extent=extent, width=2, style='arc', tags=tags)
-        else:
-            self.create_oval(x1, y1, x2, y2, width=2, tags=tags)
+        # always an arc, so the scale can be reshaped with itemconfig; Tk reduces the extent modulo 360,
+        # so a full circle is drawn as an arc just short of 360 degrees
+        arcextent = extent
+        if abs(extent) == 360:
+            arcextent = math.copysign(359.999, extent)
+        self.scalearc = self.create_arc(x1, y1, x2, y2, start=self.start, extent=arcextent, width=2, style='arc',
+                                        tags=tags)
 
         # Add unit markings and readout display (if withdisplay is enabled)
         # -----------------------------------------------------------------
@@ -335,6 +351,11 @@ class Dial(Tkinter.Canvas):
         xy2 = (self.xm - arcoffset, self.ym + 0.75 * pinrad)
         xy3 = (self.xm - arcoffset, self.ym - 0.75 * pinrad)
         self.needlecoords = [xy1, xy2, xy3]
+        # needle point offsets from the dial center, kept as separate x and y tuples; rotated about it by _draw
+        self.needledx = tuple(x - self.xm for x, y in self.needlecoords)
+        self.needledy = tuple(y - self.ym for x, y in self.needlecoords)
+        # smallest angle change (in radians) that moves the needle tip by half a pixel
+        self.needletolerance = 0.5 / (2.5 * arcoffset)
         self.needle = self.create_polygon(self.needlecoords, tags='needle')
         self.create_oval(self.xm - pinrad, self.ym - pinrad - light3D, self.xm + pinrad, self.ym + pinrad - light3D,
                          fill='gray95', outline='gray95')
@@ -348,6 +369,32 @@ class Dial(Tkinter.Canvas):
 
     # End Dial.__init__
 
+    def _scalefont(self, size):
+        # Dials of the same size under one root share the scale numbering font instead of each creating their own
+        root = self._root()
+        try:
+            fonts = Dial._scalefonts[root]
+        except KeyError:
+            fonts = Dial._scalefonts[root] = {}
+
+            # the fonts go away with their root (the root's <Destroy> binding also fires for its children)
+            def drop_fonts(event):
+                if event.widget is root:
+                    Dial._scalefonts.pop(root, None)
+
+            root.bind('<Destroy>', drop_fonts, add='+')
+        try:
+            return fonts[size]
+        except KeyError:
+            font = fonts[size] = tkFont.Font(root=root, size=size, weight='bold')
+            return font
+
+    def destroy(self):
+        """Cancel any pending redraw, then destroy the Dial."""
+        if self.drawID:
+            self.after_cancel(self.drawID)
+        Tkinter.Canvas.destroy(self)
+
     def set_value(self, value):
         """Set Dial needle to point at the given value."""
 
@@ -357,50 +404,61 @@ class Dial(Tkinter.Canvas):
         # -----------------------------------------------
         if self.value != value:
             self.value = value
-            angle = (value - self.min) * (self.end - self.start) / (self.max - self.min) + self.start
-
-            # if dial is bound, check if value is out of bounds
-            # -------------------------------------------------
-            self.outofbounds = False
-            if self.bound:
-                if self.min < self.max:  # scale is increasing (1,2,3,...)
-                    if value < self.min:
-                        angle = self.start
-                        self.outofbounds = True
-                    elif value > self.max:
-                        angle = self.end
-                        self.outofbounds = True
-                else:  # scale is decreasing (3,2,1,...)
-                    if value > self.min:
-                        angle = self.start
-                        self.outofbounds = True
-                    elif value < self.max:
-                        angle = self.end
-                        self.outofbounds = True
-
-            # rotate needle (via complex numbers)
-            # for more info on algorithm see:
-            # http://www.effbot.org/zone/tkinter-complex-canvas.htm
-            # -----------------------------------------------------
-            newxy = []
-            offset = complex(self.xm, self.ym)
-            for x, y in self.needlecoords:
-                v = cexp(math.radians(-angle) * 1j) * (complex(x, y) - offset) + offset
-                newxy.append(v.real)
-                newxy.append(v.imag)
-            self.coords(self.needle, *newxy)
-
-            # update the readout display (if enabled)
-            # ---------------------------------------
-            if self.display:
-                if self.displayroundto > 0:
-                    displayvalue = round(value, self.displayroundto)
-                else:
-                    displayvalue = int(round(value))
-                displaycolor = self.displaycolor[self.outofbounds]
-                self.itemconfig(self.display, text=displayvalue, fill=displaycolor)
+            # drawing waits until Tk is idle, so a burst of values is drawn once, with the last value
+            if not self.drawID:
+                self.drawID = self.after_idle(self._draw)
+
+    def _draw(self):
+        self.drawID = None
+        value = self.value
+        angle = (value - self.min) * (self.endrad - self.startrad) / (self.max - self.min) + self.startrad
+
+        # if dial is bound, check if value is out of bounds
+        # -------------------------------------------------
+        self.outofbounds = False
+        if self.bound:
+            if self.min < self.max:  # scale is increasing (1,2,3,...)
+                if value < self.min:
+                    angle = self.startrad
+                    self.outofbounds = True
+                elif value > self.max:
+                    angle = self.endrad
+                    self.outofbounds = True
+            else:  # scale is decreasing (3,2,1,...)
+                if value > self.min:
+                    angle = self.startrad
+                    self.outofbounds = True
+                elif value < self.max:
+                    angle = self.endrad
+                    self.outofbounds = True
+
+        # rotate needle counter-clockwise about the dial center (canvas y axis points down)
+        # skipped when the needle would move less than half a pixel
+        # ----------------------------------------------------------------------------------
+        if abs(angle - self.needleangle) >= self.needletolerance:
+            self.needleangle = angle
+            cos = math.cos(angle)
+            sin = math.sin(angle)
+            needle = zip(self.needledx, self.needledy)
+            newxy = [0] * (2 * len(needle))
+            newxy[0::2] = [self.xm + dx * cos + dy * sin for dx, dy in needle]
+            newxy[1::2] = [self.ym + dy * cos - dx * sin for dx, dy in needle]
+            self.tk.call(self._w, 'coords', self.needle, *newxy)
+
+        # update the readout display (if enabled)
+        # Tk is called directly here and above; coords and itemconfig would rebuild their arguments on every update
+        # -----------------------------------------------------------------------------------------------------------
+        if self.display:
+            if self.displayroundto > 0:
+                displayvalue = round(value, self.displayroundto)
+            else:
+                displayvalue = int(round(value))
+            displaycolor = self.displaycolor[self.outofbounds]
+            if (displayvalue, displaycolor) != self.displayed:
+                self.displayed = (displayvalue, displaycolor)
+                self.tk.call(self._w, 'itemconfigure', self.display, '-text', displayvalue, '-fill', displaycolor)
 
-    # End Dial.set_value
+    # End Dial._draw
 
 # End Dial class
 
@@ -436,6 +494,21 @@ class LED(Tkinter.Canvas):
     # ------------------
     ON = 1
     OFF = 0
+    BRIGHTNESSSTEPS = 256  # number of quantized brightness levels between OFF and ON used for fade colors
+    _brightnesstables = {}  # brightnesscolors tables shared by every LED with the same colors and reflection style
+    _rgbcache = {}  # color name -> 16-bit (r, g, b) as resolved by Tk's winfo_rgb
+    _offcolors = {}  # (bulbcolor_rgb, usemonotonereflection) -> (bulbcolor_hls, offcolor)
+    # constructor keywords -> (test the value must pass, error raised if it fails), or None if checked elsewhere
+    _kwchecks = {
+        'size': (lambda value: value > 0, 'LED size must be greater than zero'),
+        'casewidth': (lambda value: value >= 0, 'LED casewidth must be greater than or equal to zero'),
+        'state': None,
+        'diodecolor': None,
+        'bulbcolor': None,
+        'reflectstyle': None,
+        'faderate': None,
+        'blinkrate': None,
+    }
 
     # Class Methods
     # ------------------
@@ -472,47 +545,39 @@ class LED(Tkinter.Canvas):
         self.fadetimestep = 20  # time step, in ms, of the fade function
         self.isblinking = False  # Flag whether LED is currently in blinking mode
 
-        size = 100  # Size of LED
-        casewidth = 10  # Size of LED case border
-        initstate = self.state  # Initial state of LED
-        diodecolor = 'white'  # Color of the light emitting diode inside the bulb casing
-        bulbcolor = 'white'  # Color of bulb casing (white = clear); Makes the bulb colored when off
-        # Note diode and bulb color are bitwise and'ed i.e. the bulb 'filters' the diode color like a real colored bulb
-        # This behavior can be modified in the change_color function so they are bitwise or'ed to combine colors
-        reflectstyle = 0x7  # Reflection options: 0b001=visible, 0b010=color, 0b100=brightness rate (quadratic/linear)
-
         # Parse keyword arguments
         # -----------------------
         for key, value in kwargs.items():
-            if key == 'size':
-                if value > 0:
-                    size = value
-                else:
-                    raise ViewidgetError('LED size must be greater than zero')
-            elif key == 'casewidth':
-                if value >= 0:
-                    casewidth = value
-                else:
-                    raise ViewidgetError('LED casewidth must be greater than or equal to zero')
-            elif key == 'state':
-                initstate = value
-            elif key == 'diodecolor':
-                if value is not None:
-                    diodecolor = value
-            elif key == 'bulbcolor':
-                if value is not None:
-                    bulbcolor = value
-            elif key == 'reflectstyle':
-                try:
-                    reflectstyle = eval(hex(value))
-                except TypeError:
-                    warnings.warn('LED could not set reflectionsytle: must be an integer', ViewidgetWarning)
-            elif key == 'faderate':
-                self.set_faderate(value)
-            elif key == 'blinkrate':
-                self.set_blinkrate(value)
-            else:
+            try:
+                check = LED._kwchecks[key]
+            except KeyError:
                 raise ViewidgetError('LED init keyword "%s" unknown' % key)
+            if check and not check[0](value):
+                raise ViewidgetError(check[1])
+
+        size = kwargs.get('size', 100)  # Size of LED
+        casewidth = kwargs.get('casewidth', 10)  # Size of LED case border
+        initstate = kwargs.get('state', self.state)  # Initial state of LED
+        # Color of the light emitting diode inside the bulb casing
+        diodecolor = kwargs.get('diodecolor')
+        if diodecolor is None:
+            diodecolor = 'white'
+        # Color of bulb casing (white = clear); Makes the bulb colored when off
+        bulbcolor = kwargs.get('bulbcolor')
+        if bulbcolor is None:
+            bulbcolor = 'white'
+        # Note diode and bulb color are bitwise and'ed i.e. the bulb 'filters' the diode color like a real colored bulb
+        # This behavior can be modified in the change_color function so they are bitwise or'ed to combine colors
+        # Reflection options: 0b001=visible, 0b010=color, 0b100=brightness rate (quadratic/linear)
+        try:
+            reflectstyle = operator.index(kwargs.get('reflectstyle', 0x7))
+        except TypeError:
+            warnings.warn('LED could not set reflectionsytle: must be an integer', ViewidgetWarning)
+            reflectstyle = 0x7
+        if 'faderate' in kwargs:
+            self.set_faderate(kwargs['faderate'])
+        if 'blinkrate' in kwargs:
+            self.set_blinkrate(kwargs['blinkrate'])
 
         # Set initial values and check for user input errors
         # --------------------------------------------------
@@ -523,8 +588,10 @@ class LED(Tkinter.Canvas):
 
         if reflectstyle & 0x4:
             self.usereflectquadraticstep = True
+            self.reflectpower = 2  # exponent of the brightness level in the reflector luminosity
         else:
             self.usereflectquadraticstep = False
+            self.reflectpower = 1
 
         try:
             if size / casewidth < 10:
@@ -564,11 +631,25 @@ class LED(Tkinter.Canvas):
 
     # End LED.__init__
 
+    def destroy(self):
+        """Cancel any pending fade/blink callbacks, then destroy the LED."""
+        # after_cancel rejects the initial id of 0, so only cancel a callback that was scheduled
+        if self.fadeID:
+            self.after_cancel(self.fadeID)
+        self.blink_cancel()
+        Tkinter.Canvas.destroy(self)
+
     def _change_color(self, **colorargs):
         if colorargs.viewkeys() <= self.current.viewkeys():
+            drawnled = self.current['led']
+            drawnreflection = self.current['reflection']
             self.current.update(colorargs)
-            self.itemconfig(self.led, fill=self.current['led'])
-            self.itemconfig(self.reflection, outline=self.current['reflection'])
+            # fade steps often land on colors already drawn; only go to Tk for the items that changed
+            # (called directly rather than through itemconfig, which builds an option dict on every call)
+            if self.current['led'] != drawnled:
+                self.tk.call(self._w, 'itemconfigure', self.led, '-fill', self.current['led'])
+            if self.current['reflection'] != drawnreflection:
+                self.tk.call(self._w, 'itemconfigure', self.reflection, '-outline', self.current['reflection'])
         else:
             diff = colorargs.viewkeys() - self.current.viewkeys()
             raise ViewidgetError('LED color keyword "%s" unknown' % diff.pop())
@@ -620,65 +701,96 @@ class LED(Tkinter.Canvas):
         """Change color of the LED and/or the bulb casing."""
         if bulbcolor is not None:
             # offcolor['led']= bulbcolor dimmed 25% luminosity; offcolor['reflection']= bulbcolor dimmed 50% luminosity
-            self.bulbcolor_rgb = self.winfo_rgb(bulbcolor)
-            hls = self.bulbcolor_hls = rgb_to_hls(*[i / 65535 for i in self.bulbcolor_rgb])
-            offcolor = [int(round(i * 65535, 0)) for i in hls_to_rgb(hls[0], 0.25 * hls[1], hls[2])]
-            if self.usemonotonereflection:
-                sat = 0
-            else:
-                sat = hls[2]
-            reflect = [int(round(i * 65535, 0)) for i in hls_to_rgb(hls[0], 0.5 * hls[1], sat)]
-            self.offcolor = {'led': "#%04x%04x%04x" % tuple(offcolor), 'reflection': "#%04x%04x%04x" % tuple(reflect),
-                             'brightness': 0}
+            self.bulbcolor_rgb = self._rgb(bulbcolor)
+            # the off colors only depend on the bulb color and reflection style, so each pair is worked out once
+            key = (self.bulbcolor_rgb, self.usemonotonereflection)
+            try:
+                self.bulbcolor_hls, self.offcolor = LED._offcolors[key]
+            except KeyError:
+                hls = self.bulbcolor_hls = rgb_to_hls(*[i / 65535 for i in self.bulbcolor_rgb])
+                offcolor = hexcolor(*hls_to_rgb(hls[0], 0.25 * hls[1], hls[2]))
+                if self.usemonotonereflection:
+                    sat = 0
+                else:
+                    sat = hls[2]
+                reflect = hexcolor(*hls_to_rgb(hls[0], 0.5 * hls[1], sat))
+                self.offcolor = {'led': offcolor, 'reflection': reflect, 'brightness': 0}
+                LED._offcolors[key] = (self.bulbcolor_hls, self.offcolor)
         if diodecolor is not None:
-            self.diodecolor_rgb = self.winfo_rgb(diodecolor)
+            self.diodecolor_rgb = self._rgb(diodecolor)
         # oncolor['led'] = bitwise AND of diodecolor and bulbcolor; oncolor['reflection'] = white
-        oncolor = [self.diodecolor_rgb[i] & self.bulbcolor_rgb[i] for i in range(3)]
-        self.oncolor = {'led': "#%04x%04x%04x" % tuple(oncolor), 'reflection': "#FFFFFF", 'brightness': 1}
+        diode_r, diode_g, diode_b = self.diodecolor_rgb
+        bulb_r, bulb_g, bulb_b = self.bulbcolor_rgb
+        oncolor = (diode_r & bulb_r, diode_g & bulb_g, diode_b & bulb_b)
+        self.oncolor = {'led': "#%04x%04x%04x" % oncolor, 'reflection': "#FFFFFF", 'brightness': 1}
         # store oncolor HLS representation for brightness level calculations
-        self.oncolor_hls = rgb_to_hls(*[i / 65535 for i in oncolor])
+        self.oncolor_hls = rgb_to_hls(oncolor[0] / 65535, oncolor[1] / 65535, oncolor[2] / 65535)
+        # reflector luminosity goes from on.color's 1/2 luminosity to 1 (ie white) -> 0.5*hls[1] to 1
+        if self.usemonotonereflection:
+            self.reflectsat = 0
+            targetlum = self.bulbcolor_hls[1]
+        else:
+            self.reflectsat = self.oncolor_hls[2]
+            targetlum = self.oncolor_hls[1]
+        self.reflectlum = (1 - 0.5 * targetlum, 0.5 * targetlum)  # (scale, offset) of the reflector luminosity
+        # (led, reflection) colors keyed by quantized brightness level; only valid for the colors above
+        key = (oncolor, self.bulbcolor_rgb, self.usemonotonereflection, self.usereflectquadraticstep)
+        self.brightnesscolors = LED._brightnesstables.setdefault(key, {})
+        self.brightnessstep = None  # quantized brightness step currently drawn; None when off/on colors are shown
         self.set_brightness(self.current['brightness'])
 
+    def _rgb(self, color):
+        # color names resolve the same every time, so Tk is only asked once per name
+        try:
+            return LED._rgbcache[color]
+        except KeyError:
+            rgb = LED._rgbcache[color] = self.winfo_rgb(color)
+            return rgb
+
     def set_brightness(self, level):
         """Set the luminosity of the LED, from 0% to 100%."""
         if level <= 0:
+            self.brightnessstep = None
             self._change_color(**self.offcolor)
         # LED must be on or else it cannot get brighter
         elif self.state or level < self.current['brightness']:
             if level >= 1:
+                self.brightnessstep = None
                 self._change_color(**self.oncolor)
             else:
-                # color luminosity goes from on.color's 1/4 to full luminosity -> 0.25*hls[1] to hsl[1]
-                lum = self.oncolor_hls[1] * (0.75 * level + 0.25)
-                if lum < 0.2 * self.bulbcolor_hls[1]:
-                    color = self.offcolor['led']
-                    reflect = self.offcolor['reflection']
-                else:
-                    color = "#%04x%04x%04x" % tuple(
-                        [int(round(i * 65535, 0)) for i in hls_to_rgb(self.oncolor_hls[0], lum, self.oncolor_hls[2])])
-
-                    # reflector luminosity goes from on.color's 1/2 luminosity to 1 (ie white) -> 0.5*hls[1] to 1
-                    hue = self.oncolor_hls[0]
-                    if self.usemonotonereflection:
-                        sat = 0
-                        targetlum = self.bulbcolor_hls[1]
-                    else:
-                        sat = self.oncolor_hls[2]
-                        targetlum = self.oncolor_hls[1]
-                    if self.usereflectquadraticstep:
-                        power = 2
-                    else:
-                        power = 1
-                    lum = (1 - 0.5 * targetlum) * level ** power + 0.5 * targetlum
-                    reflect = "#%04x%04x%04x" % tuple([int(round(i * 65535, 0)) for i in hls_to_rgb(hue, lum, sat)])
-
+                # fades pass through the same levels over and over, so each level's colors are only computed once
+                step = int(level * LED.BRIGHTNESSSTEPS)
+                if step == self.brightnessstep:
+                    # colors for this step are already drawn; only the exact brightness moves on
+                    self.current['brightness'] = level
+                    return
+                self.brightnessstep = step
+                try:
+                    color, reflect = self.brightnesscolors[step]
+                except KeyError:
+                    color, reflect = self.brightnesscolors[step] = self._brightness_colors(step / LED.BRIGHTNESSSTEPS)
                 self._change_color(led=color, reflection=reflect, brightness=level)
 
     # End LED.set_brightness
 
+    def _brightness_colors(self, level):
+        # color luminosity goes from on.color's 1/4 to full luminosity -> 0.25*hls[1] to hsl[1]
+        lum = self.oncolor_hls[1] * (0.75 * level + 0.25)
+        if lum < 0.2 * self.bulbcolor_hls[1]:
+            return self.offcolor['led'], self.offcolor['reflection']
+
+        color = hexcolor(*hls_to_rgb(self.oncolor_hls[0], lum, self.oncolor_hls[2]))
+
+        # reflector luminosity parameters only change with the colors, so change_color works them out
+        scale, offset = self.reflectlum
+        lum = scale * level ** self.reflectpower + offset
+        reflect = hexcolor(*hls_to_rgb(self.oncolor_hls[0], lum, self.reflectsat))
+        return color, reflect
+
     def blink_cancel(self):
         """Stop the LED from blinking."""
-        self.after_cancel(self.blinkID)
+        if self.blinkID:
+            self.after_cancel(self.blinkID)
         self.isblinking = False
 
     def blink(self):
@@ -695,24 +807,27 @@ class LED(Tkinter.Canvas):
 
         # internal fade function
         def _fade(remaintime):
-            if remaintime > self.fadetimestep:
-                if len(latency) > 10:
-                    latency.popleft()
-
-                remainbrightness = targetbrightness - self.current['brightness']
-                deltabrightness = (remainbrightness / remaintime) * (self.fadetimestep + mean(latency))
-                self.set_brightness(self.current['brightness'] + deltabrightness)
+            if remaintime > timestep:
+                brightness = current['brightness']
+                deltabrightness = ((targetbrightness - brightness) / remaintime) * (timestep + mean(latency))
+                set_brightness(brightness + deltabrightness)
 
                 lastremaintime = remaintime
                 remaintime = targetremainingtime - (time() - starttime) * 1000
                 latency.append(lastremaintime - remaintime)
-                self.fadeID = self.after(self.fadetimestep, _fade, remaintime - self.fadetimestep)
+                self.fadeID = after(timestep, _fade, remaintime - timestep)
             else:
-                self.set_brightness(targetbrightness)
+                set_brightness(targetbrightness)
 
         # fade function body
-        self.after_cancel(self.fadeID)
-        latency = deque()
+        if self.fadeID:
+            self.after_cancel(self.fadeID)
+        # bound once per fade so each step reads closure variables instead of attributes
+        timestep = self.fadetimestep
+        current = self.current
+        set_brightness = self.set_brightness
+        after = self.after
+        latency = deque(maxlen=10)  # most recent step latencies; older ones drop off as new ones are appended
         if state:
             targetbrightness = self.state = LED.ON
         else:
@@ -765,6 +880,28 @@ class Digit(Tkinter.Canvas):
         0xe: 0b1010111, 'e': 0b1010111, 'E': 0b1010111,
         0xf: 0b1010101, 'f': 0b1010101, 'F': 0b1010101
     }
+    # constructor keywords -> (test the value must pass, error raised if it fails), or None if any value is accepted
+    _kwchecks = {
+        'size': (lambda value: value > 0, 'Digit size must be greater than zero'),
+        'value': None,
+        'background': None,
+        'bg': None,
+        'foreground': None,
+        'fg': None,
+    }
+    SEGMENTSTATES = (Tkinter.HIDDEN, Tkinter.NORMAL)  # segment item state, indexed by the segment's mask bit
+    # Segment polygons as fractions of the Digit size, in mask bit order: two trapezoids (top, bottom),
+    # four 5-siders (top-left, top-right, bottom-left, bottom-right) and a single 6-sider (middle)
+    SEGMENTSHAPES = (
+        ((0.09, 0.09), (0.57, 0.09), (0.47, 0.19), (0.19, 0.19)),
+        ((0.09, 0.89), (0.57, 0.89), (0.47, 0.79), (0.19, 0.79)),
+        ((0.09, 0.09), (0.09, 0.44), (0.14, 0.49), (0.19, 0.44), (0.19, 0.19)),
+        ((0.57, 0.09), (0.57, 0.44), (0.52, 0.49), (0.47, 0.44), (0.47, 0.19)),
+        ((0.09, 0.89), (0.09, 0.54), (0.14, 0.49), (0.19, 0.54), (0.19, 0.79)),
+        ((0.57, 0.89), (0.57, 0.54), (0.52, 0.49), (0.47, 0.54), (0.47, 0.79)),
+        ((0.14, 0.49), (0.19, 0.44), (0.47, 0.44), (0.52, 0.49), (0.47, 0.54), (0.19, 0.54)),
+    )
+    _geometry = {}  # size -> (segment coordinates scaled from SEGMENTSHAPES, segment outline width)
 
     # Class Methods
     # ------------------
@@ -786,26 +923,21 @@ class Digit(Tkinter.Canvas):
         """
 
         self.value = 8  # value set to 8 because that will be the display if users supplies a bad value at construction
-        size = 100  # height of Digit; width is 2/3*size
-        bg = 'black'  # default background color
-        fg = 'red'  # default digit color
-        initvalue = 0  # default value of Digit
+        self.mask = 0b1111111  # mask of the segments currently shown; all segments are drawn visible (i.e. 8)
         # Parse keyword arguments
         # -----------------------
         for key, value in kwargs.items():
-            if key == 'size':
-                if value > 0:
-                    size = value
-                else:
-                    raise ViewidgetError('Digit size must be greater than zero')
-            elif key == 'value':
-                initvalue = value
-            elif key == 'background' or key == 'bg':
-                bg = value
-            elif key == 'foreground' or key == 'fg':
-                fg = value
-            else:
+            try:
+                check = Digit._kwchecks[key]
+            except KeyError:
                 raise ViewidgetError('Digit init keyword "%s" unknown' % key)
+            if check and not check[0](value):
+                raise ViewidgetError(check[1])
+
+        size = kwargs.get('size', 100)  # height of Digit; width is 2/3*size
+        bg = kwargs.get('background', kwargs.get('bg', 'black'))  # background color
+        fg = kwargs.get('foreground', kwargs.get('fg', 'red'))  # digit color
+        initvalue = kwargs.get('value', 0)  # value of Digit
 
         # Call Canvas Constructor
         # -----------------------
@@ -814,59 +946,17 @@ class Digit(Tkinter.Canvas):
         # Draw DigitalDisplay
         # -------------------
         self.create_rectangle(0, 0, size, size, fill=bg, outline=bg, tags='bg')
-        self.segments = []
-        x1 = y1 = size * 9 / 100
-        x2 = size * 57 / 100
-        y2 = size * 89 / 100
-        y3 = size * 49 / 100
-        width = max(size // 175, 1)
-
-        # Two trapezoids
-        # --------------
-        # first segment
-        xy1 = (x1, y1)
-        xy2 = (x2, y1)
-        xy3 = (x2 - size * 1 / 10, y1 + size * 1 / 10)
-        xy4 = (x1 + size * 1 / 10, y1 + size * 1 / 10)
-        coords = [xy1, xy2, xy3, xy4]
-        seg = self.create_polygon(coords, fill=fg, outline=bg, width=width, tags='fg')
-        self.segments.append(seg)
-        # second segment
-        xy1 = (x1, y2)
-        xy2 = (x2, y2)
-        xy3 = (x2 - size * 1 / 10, y2 - size * 1 / 10)
-        xy4 = (x1 + size * 1 / 10, y2 - size * 1 / 10)
-        coords = [xy1, xy2, xy3, xy4]
-        seg = self.create_polygon(coords, fill=fg, outline=bg, width=width, tags='fg')
-        self.segments.append(seg)
-
-        # Four 5-siders
-        # -------------
-        coords = [(x1, y1), (x2, y1), (x1, y2), (x2, y2)]
-        for x, y in coords:
-            xdir = [-1, 1][x == x1]
-            ydir = [1, -1][y == y1]
-            xy1 = (x, y)
-            xy2 = (x, y3 + ydir * size * 1 / 20)
-            xy3 = (x + xdir * size * 1 / 20, y3)
-            xy4 = (x + xdir * size * 1 / 10, y3 + ydir * size * 1 / 20)
-            xy5 = (x + xdir * size * 1 / 10, y - ydir * size * 1 / 10)
-            coords = [xy1, xy2, xy3, xy4, xy5]
-            seg = self.create_polygon(coords, fill=fg, outline=bg, width=width, tags='fg')
-            self.segments.append(seg)
-
-        # Single 6-sider (middle)
-        # -----------------------
-        # seventh segment
-        xy1 = (x1 + size * 1 / 20, y3)
-        xy2 = (x1 + size * 1 / 10, y3 - size * 1 / 20)
-        xy3 = (x2 - size * 1 / 10, y3 - size * 1 / 20)
-        xy4 = (x2 - size * 1 / 20, y3)
-        xy5 = (x2 - size * 1 / 10, y3 + size * 1 / 20)
-        xy6 = (x1 + size * 1 / 10, y3 + size * 1 / 20)
-        coords = [xy1, xy2, xy3, xy4, xy5, xy6]
-        seg = self.create_polygon(coords, fill=fg, outline=bg, width=width, tags='fg')
-        self.segments.append(seg)
+        self.foreground = fg  # segment color currently drawn
+        self.background = bg  # background (and segment outline) color currently drawn
+        # digits in a display usually share one size, so each size's segment coordinates are scaled only once
+        try:
+            segmentcoords, width = Digit._geometry[size]
+        except KeyError:
+            segmentcoords = [[(x * size, y * size) for x, y in shape] for shape in Digit.SEGMENTSHAPES]
+            width = max(size // 175, 1)
+            Digit._geometry[size] = segmentcoords, width
+        self.segments = [self.create_polygon(coords, fill=fg, outline=bg, width=width, tags='fg')
+                         for coords in segmentcoords]
 
         self.set_value(initvalue)
 
@@ -874,8 +964,9 @@ class Digit(Tkinter.Canvas):
 
     def set_value(self, value):
         """Set display to the digital value (if valid)."""
-        if value in self.Masks:
-            self.set_mask(self.Masks[value])
+        mask = Digit.Masks.get(value)
+        if mask is not None:
+            self.set_mask(mask)
             self.value = value
         elif value is None:
             self.set_mask(0)
@@ -883,20 +974,22 @@ class Digit(Tkinter.Canvas):
 
     def set_mask(self, mask):
         """Set which segments are activated."""
-        for seg in self.segments:
-            if 2 ** self.segments.index(seg) & mask:
-                state = Tkinter.NORMAL
-            else:
-                state = Tkinter.HIDDEN
-            self.itemconfig(seg, state=state)
+        # only segments whose bit differs from the mask currently shown need to be reconfigured
+        changed = mask ^ self.mask
+        states = Digit.SEGMENTSTATES
+        for i, seg in enumerate(self.segments):
+            if changed >> i & 1:
+                self.itemconfig(seg, state=states[mask >> i & 1])
+        self.mask = mask
 
     def change_color(self, foreground=None, background=None):
         """Change color of the segments and/or background."""
-        if foreground is not None:
+        if foreground is not None and foreground != self.foreground:
+            self.foreground = foreground
             self.itemconfig('fg', fill=foreground)
-        if background is not None:
-            self.itemconfig('bg', fill=background)
-            self.itemconfig('bg', outline=background)
+        if background is not None and background != self.background:
+            self.background = background
+            self.itemconfig('bg', fill=background, outline=background)
             self.itemconfig('fg', outline=background)
 
 # End Digit class